@@ -0,0 +1,304 @@
+#!/usr/bin/env python3
+"""
+📈 Blackbox 검색 벤치마크 (Blackbox Search Benchmark)
+
+합성 incidents/knowhow/sessions 코퍼스를 만들어 RLMBlackboxSearch 성능 측정:
+1. 인덱스 빌드 시간 (디스크 캐시 없음)
+2. 콜드 로드 (디스크 캐시에서 새 검색기 생성) / 웜 로드 (변경 없는 refresh)
+3. search() / get_prevention_checklist() 지연시간 p50/p95/p99
+4. 최대 메모리 (tracemalloc): 빌드 중 최대/빌드 후 유지, search()/get_prevention_checklist() 중 최대
+
+사용법:
+    cd stock-predictor-dev-kit
+    python tools/bench-blackbox.py [--sizes 1000,10000,100000] [--queries 200] [--json out.json]
+
+    --sizes:   코퍼스 문서 수 (쉼표 구분)
+    --queries: 크기별 쿼리 수
+    --json:    결과를 JSON으로 저장 ('-'면 stdout)
+    --compact: compact 인덱스 모드로 측정
+"""
+
+import sys
+import json
+import time
+import random
+import shutil
+import argparse
+import tempfile
+import tracemalloc
+from pathlib import Path
+from datetime import datetime
+
+sys.path.insert(0, str(Path(__file__).parent))
+from rlm_blackbox_search import RLMBlackboxSearch  # noqa: E402
+
+# 색상
+GREEN = '\033[92m'
+BLUE = '\033[94m'
+CYAN = '\033[96m'
+RESET = '\033[0m'
+
+DEFAULT_SIZES = [1000, 10000, 100000]
+
+# 코퍼스 비율 (incidents, knowhow, sessions)
+MIX = [("incidents", 0.4), ("knowhow", 0.1), ("sessions", 0.5)]
+
+# 합성 데이터 어휘
+ERROR_TYPES = ["AttributeError", "KeyError", "TypeError", "ValueError", "ImportError",
+               "ModuleNotFoundError", "TimeoutError", "ConnectionError", "IndexError"]
+CLASSES = ["SentimentAggregator", "GeminiAnalyzer", "BacktestingEngine", "PortfolioManager",
+           "KisClient", "RedditCollector", "YoutubeCollector", "PriceCache", "SignalScorer",
+           "NewsCrawler", "ScreeningPipeline", "RiskModel", "DataStorage", "ReportBuilder"]
+METHODS = ["aggregate", "aggregate_sentiments", "analyze", "run_backtest", "fetch_prices",
+           "get_token", "collect", "score", "load", "save", "build_report", "screen",
+           "refresh", "normalize", "predict", "get_quote", "parse_response"]
+MODULES = ["sentiment_analyzer", "gemini_analyzer", "backtesting_engine", "kis_client",
+           "reddit_collector", "price_cache", "v2_endpoints", "screening", "risk_model"]
+WORDS = ["분석", "오류", "수정", "확인", "메서드", "데이터", "캐시", "배포", "로그", "응답",
+         "timeout", "retry", "token", "ticker", "None", "config", "schema", "version"]
+
+
+def _sentence(rng: random.Random, n: int) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(n))
+
+
+def _error(rng: random.Random) -> str:
+    """에러 메시지 한 줄 (쿼리/문서 공용)"""
+    error_type = rng.choice(ERROR_TYPES)
+    cls = rng.choice(CLASSES)
+    method = rng.choice(METHODS)
+    module = rng.choice(MODULES)
+    return rng.choice([
+        f"{error_type}: '{cls}' object has no attribute '{method}'",
+        f"{error_type} in {module}.py: {cls}.{method}() failed",
+        f"File \"/app/modules/{module}.py\", line {rng.randint(1, 900)}, in {method}\n{error_type}: {cls}",
+    ])
+
+
+def make_incident(rng: random.Random, i: int) -> dict:
+    error = _error(rng)
+    cls = rng.choice(CLASSES)
+    module = rng.choice(MODULES)
+    return {
+        "id": f"incident-bench-{i:06d}",
+        "severity": rng.choice(["critical", "high", "medium", "low"]),
+        "title": f"{cls}.{rng.choice(METHODS)} {_sentence(rng, 3)}",
+        "date": f"2026-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}",
+        "symptom": error.splitlines()[-1],
+        "error_log": f"[{rng.choice(WORDS)}] {rng.randint(0, 999999):06d}.KS {error}",
+        "root_cause": {
+            "description": f"{module}.py {_sentence(rng, 8)}",
+            "wrong_code": f"self.x.{rng.choice(METHODS)}(data)",
+            "correct_code": f"self.x.{rng.choice(METHODS)}(data=...)",
+        },
+        "solution": {
+            "description": _sentence(rng, 10),
+            "files_fixed": [f"backend/modules/{module}.py"],
+            "commit": f"{rng.getrandbits(28):07x}",
+        },
+        "prevention": {
+            "rule": _sentence(rng, 8),
+            "check_command": f"grep 'def ' modules/{module}.py | head -20",
+            "related_rules": [f"GEN-{rng.randint(1, 20):03d}"],
+        },
+        "resolution_time_minutes": rng.randint(1, 240),
+    }
+
+
+def make_knowhow(rng: random.Random, i: int) -> dict:
+    error_type = rng.choice(ERROR_TYPES)
+    return {
+        "category": error_type,
+        "description": _sentence(rng, 10),
+        "patterns": [
+            {
+                "id": f"bench-{i:06d}-{j}",
+                "symptom": _error(rng).splitlines()[-1],
+                "causes": [_sentence(rng, 4) for _ in range(3)],
+                "diagnosis_steps": [f"{k}. {_sentence(rng, 6)}" for k in range(1, 4)],
+                "prevention": _sentence(rng, 8),
+            }
+            for j in range(rng.randint(1, 4))
+        ],
+        "quick_fix_commands": [f"grep 'class ' {rng.choice(MODULES)}.py"],
+        "updated": "2026-01-01",
+    }
+
+
+def make_session(rng: random.Random, i: int) -> dict:
+    return {
+        "date": f"2026-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}",
+        "session_id": f"bench-{i:06d}",
+        "agent_summary": _sentence(rng, 8),
+        "work_completed": [
+            {
+                "task": _sentence(rng, 4),
+                "description": _sentence(rng, 12),
+                "files_changed": [f"analysis_engines/{rng.choice(MODULES)}.py" for _ in range(2)],
+                "key_decisions": [_sentence(rng, 6) for _ in range(3)],
+            }
+            for _ in range(rng.randint(2, 8))
+        ],
+        "errors_encountered": [_error(rng) for _ in range(rng.randint(0, 3))],
+    }
+
+
+MAKERS = {"incidents": make_incident, "knowhow": make_knowhow, "sessions": make_session}
+
+
+def generate_corpus(root: Path, size: int, seed: int = 42):
+    """size개 문서의 합성 blackbox 생성"""
+    rng = random.Random(seed)
+    for source, ratio in MIX:
+        source_path = root / source
+        source_path.mkdir(parents=True, exist_ok=True)
+        maker = MAKERS[source]
+        for i in range(max(1, int(size * ratio))):
+            with open(source_path / f"{source}-{i:06d}.json", "w", encoding="utf-8") as f:
+                json.dump(maker(rng, i), f, ensure_ascii=False)
+
+
+def percentiles(samples: list) -> dict:
+    """지연시간 샘플(초) -> ms 단위 p50/p95/p99"""
+    ordered = sorted(samples)
+
+    def pick(p: float) -> float:
+        return ordered[min(len(ordered) - 1, int(p * len(ordered)))] * 1000
+
+    return {"p50_ms": pick(0.50), "p95_ms": pick(0.95), "p99_ms": pick(0.99),
+            "mean_ms": sum(ordered) / len(ordered) * 1000}
+
+
+def time_calls(fn, queries: list) -> dict:
+    samples = []
+    for query in queries:
+        start = time.perf_counter()
+        fn(query)
+        samples.append(time.perf_counter() - start)
+    return percentiles(samples)
+
+
+def peak_calls(fn, queries: list) -> int:
+    """queries를 실행하는 동안 새로 할당된 메모리의 최대치 (바이트, 시간 측정과 별도 실행)"""
+    tracemalloc.start()
+    try:
+        for query in queries:
+            fn(query)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak
+
+
+def bench_size(size: int, n_queries: int, compact: bool, seed: int) -> dict:
+    """코퍼스 하나에 대한 측정"""
+    root = Path(tempfile.mkdtemp(prefix="blackbox-bench-"))
+    try:
+        start = time.perf_counter()
+        generate_corpus(root, size, seed)
+        generate_seconds = time.perf_counter() - start
+
+        # 빌드 (캐시 없음, 캐시 파일 저장 포함)
+        start = time.perf_counter()
+        RLMBlackboxSearch(str(root), compact=compact)
+        build_seconds = time.perf_counter() - start
+
+        # 최대 메모리는 별도 빌드로 측정 (tracemalloc이 시간 측정을 왜곡하므로)
+        tracemalloc.start()
+        built = RLMBlackboxSearch(str(root), use_cache=False, compact=compact)
+        build_retained, build_peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        del built
+
+        # 콜드 로드 (디스크 캐시) / 웜 로드 (변경 없는 refresh)
+        start = time.perf_counter()
+        searcher = RLMBlackboxSearch(str(root), compact=compact, query_cache_size=0)
+        cold_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        searcher.refresh()
+        warm_seconds = time.perf_counter() - start
+
+        rng = random.Random(seed + 1)
+        queries = [_error(rng) for _ in range(n_queries)]
+
+        search = time_calls(searcher.search, queries)
+        checklist = time_calls(searcher.get_prevention_checklist, queries)
+        search["peak_bytes"] = peak_calls(searcher.search, queries)
+        checklist["peak_bytes"] = peak_calls(searcher.get_prevention_checklist, queries)
+
+        # 쿼리 캐시 적중 시
+        cached = RLMBlackboxSearch(str(root), compact=compact)
+        for query in queries:
+            cached.search(query)
+        search_cached = time_calls(cached.search, queries)
+
+        return {
+            "size": size,
+            "documents": searcher.get_stats()["total_items"],
+            "generate_seconds": generate_seconds,
+            "build_seconds": build_seconds,
+            "build_peak_bytes": build_peak,
+            "index_retained_bytes": build_retained,
+            "cold_load_seconds": cold_seconds,
+            "warm_load_seconds": warm_seconds,
+            "search": search,
+            "search_cached": search_cached,
+            "get_prevention_checklist": checklist,
+        }
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+
+
+def print_result(result: dict):
+    print(f"{BLUE}[{result['size']:,} docs]{RESET} indexed {result['documents']:,}")
+    print(f"   build:       {result['build_seconds']:.3f}s "
+          f"(peak {result['build_peak_bytes'] / 1024 / 1024:.1f} MiB, "
+          f"retained {result['index_retained_bytes'] / 1024 / 1024:.1f} MiB)")
+    print(f"   cold load:   {result['cold_load_seconds']:.3f}s")
+    print(f"   warm load:   {result['warm_load_seconds']:.3f}s")
+    for name in ["search", "search_cached", "get_prevention_checklist"]:
+        stats = result[name]
+        peak = f"  peak {stats['peak_bytes'] / 1024:.0f} KiB" if "peak_bytes" in stats else ""
+        print(f"   {name:<25} p50 {stats['p50_ms']:.3f}ms  "
+              f"p95 {stats['p95_ms']:.3f}ms  p99 {stats['p99_ms']:.3f}ms{peak}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Blackbox search benchmark")
+    parser.add_argument("--sizes", default=",".join(str(s) for s in DEFAULT_SIZES))
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--compact", action="store_true")
+    parser.add_argument("--json", dest="json_path")
+    args = parser.parse_args()
+
+    sizes = [int(s) for s in args.sizes.split(",") if s.strip()]
+
+    print(f"{CYAN}📈 Blackbox Search Benchmark{RESET}\n", file=sys.stderr)
+
+    results = []
+    for size in sizes:
+        result = bench_size(size, args.queries, args.compact, args.seed)
+        results.append(result)
+        if args.json_path != "-":
+            print_result(result)
+
+    report = {
+        "timestamp": datetime.now().isoformat(),
+        "python": sys.version.split()[0],
+        "compact": args.compact,
+        "queries": args.queries,
+        "results": results,
+    }
+
+    if args.json_path == "-":
+        print(json.dumps(report, indent=2))
+    elif args.json_path:
+        with open(args.json_path, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"\n{GREEN}✅ Saved: {args.json_path}{RESET}")
+
+
+if __name__ == "__main__":
+    main()
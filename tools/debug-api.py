@@ -9,18 +9,35 @@ API 엔드포인트 테스트 도구
 - V2 API
 
 사용법:
-    python debug-api.py [URL]
+    python debug-api.py [URL] [--load] [--concurrency N] [--requests N | --duration S] [--only TEXT] [--json]
+    python debug-api.py [URL] --slo [--samples N] [--threshold R] [--save-baseline]
     
 예시:
     python debug-api.py                           # 로컬 (localhost:8000)
     python debug-api.py https://your-backend.up.railway.app
+    python debug-api.py --load --concurrency 10 --requests 200 --only /api/stocks/search
+    
+    --load:        부하 테스트 모드 (엔드포인트별 처리량/지연시간 분포/에러율)
+    --concurrency: 동시 요청 수 (기본값 10)
+    --requests:    엔드포인트별 총 요청 수 (기본값 100)
+    --duration:    요청 수 대신 엔드포인트별 실행 시간(초)
+    --only:        이름이나 경로에 TEXT가 들어간 엔드포인트만 (여러 번 지정 가능)
+    --json:        응답 본문을 JSON으로 파싱해 검증 (기본은 바이트 수만 측정)
+    --slo:         엔드포인트별 지연시간 예산(p95_ms)과 저장된 기준선 대비 회귀 검사 (위반 시 exit 1)
+    --samples:     --slo에서 엔드포인트별 요청 수 (기본값 20, 워밍업 1회 별도)
+    --threshold:   기준선 대비 허용 증가율 (기본값 0.2 = 20%)
+    --save-baseline: 이번 측정 결과를 기준선으로 저장 (SLO 위반이 있으면 저장하지 않음)
 """
 
 import sys
 import json
 import time
-from urllib.request import urlopen, Request
-from urllib.error import HTTPError, URLError
+from pathlib import Path
+import argparse
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import http.client
+from urllib.parse import urlsplit, urljoin, quote
 
 # 색상
 RED = '\033[91m'
@@ -29,64 +46,341 @@ YELLOW = '\033[93m'
 BLUE = '\033[94m'
 RESET = '\033[0m'
 
+# 응답 본문 읽기 단위
+CHUNK_SIZE = 64 * 1024
 
-def test_endpoint(base_url: str, path: str, method: str = 'GET', data: dict = None, timeout: int = 30) -> dict:
-    """엔드포인트 테스트"""
-    url = f"{base_url}{path}"
+# 테스트 케이스: (이름, 경로, 메서드, 요청 본문, 예산)
+# 예산 max_bytes: 응답 본문이 이보다 크면 성능 회귀로 실패 처리
+# 예산 p95_ms: --slo 모드에서 p95 지연시간이 이보다 길면 실패 처리
+TESTS = [
+    # 기본
+    ("Health Check", "/", "GET", None, {"max_bytes": 4 * 1024, "p95_ms": 500}),
+    ("API Health", "/api/health", "GET", None, {"max_bytes": 4 * 1024, "p95_ms": 500}),
     
-    start = time.time()
+    # 종목 검색
+    ("종목 검색 (삼성)", "/api/stocks/search?q=삼성&max_items=5", "GET", None,
+     {"max_bytes": 64 * 1024, "p95_ms": 1500}),
+    ("종목 검색 (AAPL)", "/api/stocks/search?q=AAPL&max_items=5", "GET", None,
+     {"max_bytes": 64 * 1024, "p95_ms": 1500}),
     
-    try:
-        if data:
-            req = Request(
-                url,
-                data=json.dumps(data).encode('utf-8'),
-                headers={'Content-Type': 'application/json'},
-                method=method
-            )
-        else:
-            req = Request(url, method=method)
+    # 시장 데이터
+    ("시장 지수", "/api/market/indices", "GET", None, {"max_bytes": 256 * 1024, "p95_ms": 3000}),
+    ("환율", "/api/market/exchange", "GET", None, {"max_bytes": 64 * 1024, "p95_ms": 2000}),
+    
+    # V2 API
+    ("V2 Health", "/api/v2/health", "GET", None, {"max_bytes": 4 * 1024, "p95_ms": 500}),
+    ("V2 Engines", "/api/v2/engines", "GET", None, {"max_bytes": 64 * 1024, "p95_ms": 1000}),
+    
+    # 분석 (시간이 오래 걸림)
+    ("분석 (SK하이닉스)", "/api/analyze", "POST", {"ticker": "000660.KS", "period": "1mo"},
+     {"max_bytes": 1024 * 1024, "p95_ms": 10000}),
+]
+
+# --slo 기준선 파일 (서버 URL별 엔드포인트 지연시간 분포)
+BASELINE_FILE = Path(__file__).parent / '.api-baseline.json'
+
+# 기준선 비교 시 이보다 작은 증가(ms)는 무시 (네트워크 잡음)
+REGRESSION_MIN_MS = 50
+
+# --slo 기본 표본 수 (nearest-rank p95가 최댓값과 같아지지 않을 만큼)
+SLO_SAMPLES = 20
+
+# 따라갈 리다이렉트 상태 코드와 최대 횟수
+REDIRECT_STATUSES = {301, 302, 303, 307, 308}
+MAX_REDIRECTS = 5
+
+# 끊긴 keep-alive 연결에서 실패했을 때 다시 보내도 안전한 메서드
+IDEMPOTENT_METHODS = {'GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE'}
+
+
+class ConnectionPool:
+    """
+    호스트별 keep-alive 연결 풀 (http.client 기반, 스레드 안전)
+    
+    같은 (scheme, host, port)로 가는 요청은 쉬고 있는 연결을 재사용해
+    TCP/TLS 핸드셰이크 비용이 지연시간 측정에 섞이지 않게 함
+    """
+    
+    def __init__(self):
+        self._idle = {}
+        self._lock = threading.Lock()
+    
+    def acquire(self, scheme: str, netloc: str, timeout: int, fresh: bool = False) -> http.client.HTTPConnection:
+        """
+        쉬고 있는 연결을 꺼내거나 새 연결 객체 생성 (아직 connect 전일 수 있음)
+        
+        fresh=True면 풀을 건너뛰고 항상 새 연결 객체 생성
+        """
+        key = (scheme, netloc)
+        with self._lock:
+            idle = self._idle.get(key)
+            if idle and not fresh:
+                conn = idle.pop()
+                conn.timeout = timeout
+                if conn.sock is not None:
+                    conn.sock.settimeout(timeout)
+                return conn
+        
+        conn_cls = http.client.HTTPSConnection if scheme == 'https' else http.client.HTTPConnection
+        return conn_cls(netloc, timeout=timeout)
+    
+    def release(self, scheme: str, netloc: str, conn: http.client.HTTPConnection):
+        """재사용할 수 있는 연결을 풀에 반환"""
+        with self._lock:
+            self._idle.setdefault((scheme, netloc), []).append(conn)
+    
+    def close(self):
+        with self._lock:
+            for idle in self._idle.values():
+                for conn in idle:
+                    conn.close()
+            self._idle.clear()
+
+
+# 모듈 공용 연결 풀
+POOL = ConnectionPool()
+
+
+def read_body(response: http.client.HTTPResponse, keep: bool) -> tuple:
+    """
+    응답 본문을 CHUNK_SIZE 단위로 읽기
+    
+    keep=False면 바이트 수만 세고 버림. (본문 또는 None, 바이트 수) 반환
+    """
+    chunks = [] if keep else None
+    size = 0
+    while True:
+        chunk = response.read(CHUNK_SIZE)
+        if not chunk:
+            break
+        size += len(chunk)
+        if keep:
+            chunks.append(chunk)
+    return (b"".join(chunks) if keep else None), size
+
+
+def send_request(pool: ConnectionPool, url: str, method: str, body: bytes, headers: dict,
+                 timeout: int, keep_body: bool) -> dict:
+    """
+    요청 한 번 보내기 (리다이렉트는 따라가지 않음)
+    
+    (response, 본문 또는 None, 바이트 수, elapsed, connect, ttfb, reused) 또는 {"error": ...} 반환.
+    keep_body=False여도 4xx/5xx 응답 본문은 에러 메시지용으로 보관
+    """
+    parts = urlsplit(url)
+    target = quote(parts.path or '/', safe="/%:@") + (f"?{quote(parts.query, safe='=&%+:,@/')}" if parts.query else "")
+    
+    # 재사용한 연결이 서버 쪽에서 이미 닫혔으면 (멱등 요청만) 새 연결로 한 번 더 시도
+    retry = method.upper() in IDEMPOTENT_METHODS
+    for attempt in range(2):
+        conn = pool.acquire(parts.scheme, parts.netloc, timeout, fresh=attempt > 0)
+        reused = conn.sock is not None
+        start = time.perf_counter()
+        connect = 0.0
         
-        with urlopen(req, timeout=timeout) as response:
-            elapsed = time.time() - start
-            body = json.loads(response.read().decode('utf-8'))
-            
-            return {
-                "success": True,
-                "status": response.status,
-                "elapsed": f"{elapsed:.2f}s",
-                "body": body
-            }
-    
-    except HTTPError as e:
-        elapsed = time.time() - start
         try:
-            body = json.loads(e.read().decode('utf-8'))
-        except:
-            body = e.reason
+            if not reused:
+                conn.connect()
+                connect = time.perf_counter() - start
+            
+            conn.request(method, target, body=body, headers=headers)
+            response = conn.getresponse()
+            ttfb = time.perf_counter() - start - connect
+            raw, size = read_body(response, keep=keep_body or response.status >= 400)
+            elapsed = time.perf_counter() - start
+        except (http.client.RemoteDisconnected, BrokenPipeError, ConnectionResetError) as e:
+            conn.close()
+            if reused and retry and attempt == 0:
+                continue
+            return {"error": str(e)}
+        except Exception as e:
+            conn.close()
+            return {"error": str(e)}
+        
+        if response.will_close:
+            conn.close()
+        else:
+            pool.release(parts.scheme, parts.netloc, conn)
+        return response, raw, size, elapsed, connect, ttfb, reused
+
+
+def test_endpoint(base_url: str, path: str, method: str = 'GET', data: dict = None, timeout: int = 30,
+                  pool: ConnectionPool = None, parse_json: bool = False, max_bytes: int = None) -> dict:
+    """
+    엔드포인트 테스트
+    
+    시간은 connect(새 연결일 때만), TTFB(요청 전송 ~ 응답 헤더), total(본문까지)로 나눠 기록.
+    본문은 청크 단위로 읽어 크기/전송 속도만 재고, parse_json=True일 때만 보관 후 파싱.
+    max_bytes를 넘는 응답은 실패로 처리.
+    3xx는 Location을 따라가며 (최대 MAX_REDIRECTS회, 같은 호스트면 풀 연결 재사용)
+    시간은 모든 요청을 합산
+    """
+    pool = pool or POOL
+    url = f"{base_url}{path}"
+    body = json.dumps(data).encode('utf-8') if data else None
+    
+    elapsed = connect = ttfb = 0.0
+    reused = True
+    redirects = 0
+    while True:
+        headers = {'Content-Type': 'application/json'} if body else {}
+        sent = send_request(pool, url, method, body, headers, timeout, parse_json)
+        if isinstance(sent, dict):
+            return {"success": False, "status": 0, "elapsed": "-", **sent}
+        
+        response, raw, size, hop_elapsed, hop_connect, hop_ttfb, hop_reused = sent
+        elapsed += hop_elapsed
+        connect += hop_connect
+        ttfb += hop_ttfb
+        reused = reused and hop_reused
+        
+        location = response.getheader('Location')
+        if response.status not in REDIRECT_STATUSES or not location:
+            break
         
-        return {
-            "success": False,
-            "status": e.code,
-            "elapsed": f"{elapsed:.2f}s",
-            "error": body
-        }
-    
-    except URLError as e:
-        return {
-            "success": False,
-            "status": 0,
-            "elapsed": "-",
-            "error": str(e.reason)
-        }
+        redirects += 1
+        if redirects > MAX_REDIRECTS:
+            return {"success": False, "status": response.status, "elapsed": f"{elapsed:.2f}s",
+                    "error": f"리다이렉트 {MAX_REDIRECTS}회 초과 (마지막: {location})"}
+        
+        # 303, 그리고 POST의 301/302는 브라우저/urllib처럼 본문 없는 GET으로
+        if response.status == 303 or (response.status in (301, 302) and method.upper() == 'POST'):
+            method, body = 'GET', None
+        url = urljoin(url, location)
+    
+    transfer = hop_elapsed - hop_connect - hop_ttfb
+    timings = {
+        "elapsed": f"{elapsed:.2f}s",
+        "seconds": elapsed,
+        "connect": connect,
+        "ttfb": ttfb,
+        "reused": reused,
+        "bytes": size,
+        "rate": size / transfer if transfer > 0 else None,  # bytes/s (마지막 응답 본문 전송 구간)
+    }
+    if redirects:
+        timings["redirects"] = redirects
+        timings["final_url"] = url
+    
+    if response.status >= 300:
+        try:
+            error = json.loads(raw.decode('utf-8'))
+        except Exception:
+            error = response.reason
+        if response.status < 400:
+            error = f"{response.status} {response.reason} (Location 없음)"
+        return {"success": False, "status": response.status, "error": error, **timings}
     
+    if max_bytes is not None and size > max_bytes:
+        return {"success": False, "status": response.status, "oversized": True,
+                "error": f"응답 크기 초과: {format_bytes(size)} > 예산 {format_bytes(max_bytes)}", **timings}
+    
+    if not parse_json:
+        return {"success": True, "status": response.status, **timings}
+    
+    try:
+        parsed = json.loads(raw.decode('utf-8'))
     except Exception as e:
-        return {
-            "success": False,
-            "status": 0,
-            "elapsed": "-",
-            "error": str(e)
-        }
+        return {"success": False, "status": response.status, "error": f"Invalid JSON: {e}", **timings}
+    
+    return {"success": True, "status": response.status, "body": parsed, **timings}
+
+
+def format_bytes(size: float) -> str:
+    for unit in ["B", "KB", "MB"]:
+        if size < 1024 or unit == "MB":
+            return f"{size:.0f}{unit}" if unit == "B" else f"{size:.1f}{unit}"
+        size /= 1024
+
+
+def percentile(sorted_values: list, p: float) -> float:
+    """정렬된 값에서 p 분위수 (nearest-rank)"""
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, int(round(p * len(sorted_values))) - 1))
+    return sorted_values[index]
+
+
+def load_test(base_url: str, path: str, method: str = 'GET', data: dict = None,
+              concurrency: int = 10, requests: int = 100, duration: float = None,
+              timeout: int = 30, max_bytes: int = None, warmup: int = 0,
+              exclude_connect: bool = False) -> dict:
+    """
+    엔드포인트 부하 테스트
+    
+    concurrency개 스레드가 requests개 요청을 나눠 보내거나,
+    duration이 있으면 그 시간(초) 동안 계속 보냄.
+    warmup회 요청은 먼저 보내고 버리며 (연결 풀/서버 캐시 데우기),
+    exclude_connect=True면 지연시간에서 TCP/TLS 연결 시간을 뺌
+    """
+    for _ in range(warmup):
+        test_endpoint(base_url, path, method, data, timeout, max_bytes=max_bytes)
+    
+    lock = threading.Lock()
+    latencies = []
+    errors = {}
+    issued = [0]
+    deadline = time.perf_counter() + duration if duration else None
+    
+    def worker():
+        while True:
+            with lock:
+                if deadline is None and issued[0] >= requests:
+                    return
+                issued[0] += 1
+            if deadline is not None and time.perf_counter() >= deadline:
+                return
+            
+            start = time.perf_counter()
+            result = test_endpoint(base_url, path, method, data, timeout, max_bytes=max_bytes)
+            elapsed = time.perf_counter() - start
+            if exclude_connect and "seconds" in result:
+                elapsed = result["seconds"] - result["connect"]
+            
+            with lock:
+                if result["success"]:
+                    latencies.append(elapsed)
+                else:
+                    key = "oversized" if result.get("oversized") else (result["status"] or result.get("error", "error"))
+                    errors[str(key)] = errors.get(str(key), 0) + 1
+    
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        for _ in range(concurrency):
+            pool.submit(worker)
+    wall = time.perf_counter() - started
+    
+    latencies.sort()
+    total = len(latencies) + sum(errors.values())
+    return {
+        "requests": total,
+        "ok": len(latencies),
+        "errors": errors,
+        "error_rate": (total - len(latencies)) / total if total else 0.0,
+        "wall_seconds": wall,
+        "throughput": total / wall if wall > 0 else 0.0,
+        "p50": percentile(latencies, 0.50),
+        "p90": percentile(latencies, 0.90),
+        "p95": percentile(latencies, 0.95),
+        "p99": percentile(latencies, 0.99),
+        "max": latencies[-1] if latencies else 0.0,
+    }
+
+
+def print_load_result(name: str, stats: dict):
+    """부하 테스트 결과 출력"""
+    color = GREEN if stats["error_rate"] == 0 else (YELLOW if stats["error_rate"] < 0.05 else RED)
+    
+    print(f"  📈 {name}")
+    print(f"     Requests: {stats['requests']} ({stats['throughput']:.1f} req/s)")
+    print(f"     Latency: p50 {stats['p50'] * 1000:.0f}ms | p90 {stats['p90'] * 1000:.0f}ms | "
+          f"p99 {stats['p99'] * 1000:.0f}ms | max {stats['max'] * 1000:.0f}ms")
+    print(f"     Errors: {color}{stats['error_rate'] * 100:.1f}%{RESET}", end="")
+    if stats["errors"]:
+        print(f" ({', '.join(f'{k}: {v}' for k, v in stats['errors'].items())})")
+    else:
+        print()
+    print()
 
 
 def print_result(name: str, result: dict):
@@ -100,7 +394,15 @@ def print_result(name: str, result: dict):
     
     print(f"  {icon} {name}")
     print(f"     Status: {status_color}{result['status']}{RESET}")
-    print(f"     Time: {result['elapsed']}")
+    if "ttfb" in result:
+        connect = f"connect {result['connect'] * 1000:.0f}ms" if not result["reused"] else "reused"
+        print(f"     Time: {result['elapsed']} ({connect}, TTFB {result['ttfb'] * 1000:.0f}ms)")
+        rate = f" @ {format_bytes(result['rate'])}/s" if result["rate"] else ""
+        print(f"     Size: {format_bytes(result['bytes'])}{rate}")
+        if result.get("redirects"):
+            print(f"     Redirect: {result['redirects']}회 → {result['final_url']}")
+    else:
+        print(f"     Time: {result['elapsed']}")
     
     if not result["success"]:
         print(f"     Error: {RED}{result.get('error', 'Unknown')}{RESET}")
@@ -108,48 +410,153 @@ def print_result(name: str, result: dict):
     print()
 
 
+def parse_args(argv: list) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="API 엔드포인트 테스트 도구")
+    parser.add_argument("url", nargs="?", default="http://localhost:8000")
+    parser.add_argument("--load", action="store_true")
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--requests", type=int, default=100)
+    parser.add_argument("--duration", type=float)
+    parser.add_argument("--only", action="append", default=[])
+    parser.add_argument("--json", action="store_true")
+    parser.add_argument("--slo", action="store_true")
+    parser.add_argument("--samples", type=int, default=SLO_SAMPLES)
+    parser.add_argument("--threshold", type=float, default=0.2)
+    parser.add_argument("--save-baseline", action="store_true")
+    return parser.parse_args(argv)
+
+
+def select_tests(only: list) -> list:
+    """--only 필터 적용"""
+    if not only:
+        return TESTS
+    return [t for t in TESTS if any(text in t[0] or text in t[1] for text in only)]
+
+
+def run_load(base_url: str, tests: list, args: argparse.Namespace) -> int:
+    """부하 테스트 모드"""
+    limit = f"{args.duration:g}초" if args.duration else f"{args.requests}회"
+    print(f"🔥 부하 테스트: 동시 {args.concurrency}, 엔드포인트별 {limit}\n")
+    
+    failed = []
+    for name, path, method, data, budget in tests:
+        print(f"🔍 Loading: {name}...")
+        stats = load_test(base_url, path, method, data, args.concurrency, args.requests, args.duration,
+                          max_bytes=budget.get("max_bytes"))
+        print_load_result(name, stats)
+        if stats["ok"] == 0:
+            failed.append(name)
+    
+    print(f"{BLUE}========================================{RESET}")
+    if failed:
+        print(f"{RED}❌ 응답 없음: {', '.join(failed)}{RESET}")
+    else:
+        print(f"{GREEN}✅ 부하 테스트 완료{RESET}")
+    print(f"{BLUE}========================================{RESET}")
+    
+    return 1 if failed else 0
+
+
+def load_baseline() -> dict:
+    if not BASELINE_FILE.exists():
+        return {}
+    try:
+        with open(BASELINE_FILE, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def run_slo(base_url: str, tests: list, args: argparse.Namespace) -> int:
+    """
+    지연시간 SLO 검사
+    
+    엔드포인트마다 워밍업 1회 후 samples회 순차 요청해 (연결 시간 제외) 분위수를 구하고
+    1) 예산 p95_ms 초과, 2) 기준선 p95 대비 threshold 이상 증가(REGRESSION_MIN_MS 이상)면 실패
+    """
+    baseline_all = load_baseline()
+    baseline = baseline_all.get(base_url, {})
+    print(f"⏱️ SLO 검사: 엔드포인트별 {args.samples}회, 기준선 "
+          f"{'있음' if baseline else '없음'}, 허용 증가율 {args.threshold * 100:.0f}%\n")
+    
+    measured = {}
+    violations = []
+    for name, path, method, data, budget in tests:
+        stats = load_test(base_url, path, method, data, concurrency=1, requests=args.samples,
+                          max_bytes=budget.get("max_bytes"), warmup=1, exclude_connect=True)
+        p95_ms = stats["p95"] * 1000
+        
+        problems = []
+        if stats["ok"] == 0:
+            problems.append(f"응답 실패 ({', '.join(f'{k}: {v}' for k, v in stats['errors'].items())})")
+        else:
+            measured[name] = {k: stats[k] for k in ("p50", "p90", "p95", "p99", "max", "error_rate")}
+            
+            if "p95_ms" in budget and p95_ms > budget["p95_ms"]:
+                problems.append(f"예산 초과: p95 {p95_ms:.0f}ms > {budget['p95_ms']}ms")
+            
+            previous = baseline.get(name)
+            if previous:
+                base_ms = previous["p95"] * 1000
+                if p95_ms > base_ms * (1 + args.threshold) and p95_ms - base_ms >= REGRESSION_MIN_MS:
+                    problems.append(f"회귀: p95 {p95_ms:.0f}ms (기준선 {base_ms:.0f}ms, "
+                                    f"{(p95_ms / base_ms - 1) * 100:+.0f}%)")
+        
+        icon = f"{RED}❌" if problems else f"{GREEN}✅"
+        print(f"  {icon} {name}{RESET}: p50 {stats['p50'] * 1000:.0f}ms | p95 {p95_ms:.0f}ms"
+              + (f" / 예산 {budget['p95_ms']}ms" if "p95_ms" in budget else ""))
+        for problem in problems:
+            print(f"     {RED}{problem}{RESET}")
+        if problems:
+            violations.append(name)
+    
+    # 회귀가 새 기준선이 되지 않도록 위반이 있으면 저장하지 않음
+    if args.save_baseline and violations:
+        print(f"\n{YELLOW}⚠️ SLO 위반이 있어 기준선을 저장하지 않았습니다.{RESET}")
+    elif args.save_baseline:
+        baseline_all[base_url] = {**baseline, **measured}
+        with open(BASELINE_FILE, 'w', encoding='utf-8') as f:
+            json.dump(baseline_all, f, indent=2, ensure_ascii=False)
+        print(f"\n💾 기준선 저장: {BASELINE_FILE.name} ({len(measured)}개 엔드포인트)")
+    
+    print(f"\n{BLUE}========================================{RESET}")
+    if violations:
+        print(f"{RED}❌ SLO 위반: {', '.join(violations)}{RESET}")
+    else:
+        print(f"{GREEN}✅ 모든 엔드포인트 SLO 충족{RESET}")
+    print(f"{BLUE}========================================{RESET}")
+    
+    return 1 if violations else 0
+
+
 def main():
+    args = parse_args(sys.argv[1:])
+    
     print(f"{BLUE}========================================{RESET}")
     print(f"{BLUE}     API 엔드포인트 테스트 도구       {RESET}")
     print(f"{BLUE}========================================{RESET}\n")
     
-    # 기본 URL
-    base_url = sys.argv[1] if len(sys.argv) > 1 else "http://localhost:8000"
-    
     # 후행 슬래시 제거
-    base_url = base_url.rstrip('/')
+    base_url = args.url.rstrip('/')
     
     print(f"🌐 대상 서버: {base_url}\n")
     
-    # 테스트 케이스
-    tests = [
-        # 기본
-        ("Health Check", "/", "GET", None),
-        ("API Health", "/api/health", "GET", None),
-        
-        # 종목 검색
-        ("종목 검색 (삼성)", "/api/stocks/search?q=삼성&max_items=5", "GET", None),
-        ("종목 검색 (AAPL)", "/api/stocks/search?q=AAPL&max_items=5", "GET", None),
-        
-        # 시장 데이터
-        ("시장 지수", "/api/market/indices", "GET", None),
-        ("환율", "/api/market/exchange", "GET", None),
-        
-        # V2 API
-        ("V2 Health", "/api/v2/health", "GET", None),
-        ("V2 Engines", "/api/v2/engines", "GET", None),
-        
-        # 분석 (시간이 오래 걸림)
-        ("분석 (SK하이닉스)", "/api/analyze", "POST", {"ticker": "000660.KS", "period": "1mo"}),
-    ]
+    tests = select_tests(args.only)
+    
+    if args.load:
+        return run_load(base_url, tests, args)
+    
+    if args.slo:
+        return run_slo(base_url, tests, args)
     
     # 테스트 실행
     results = []
     success_count = 0
     
-    for name, path, method, data in tests:
+    for name, path, method, data, budget in tests:
         print(f"🔍 Testing: {name}...")
-        result = test_endpoint(base_url, path, method, data)
+        result = test_endpoint(base_url, path, method, data, parse_json=args.json,
+                               max_bytes=budget.get("max_bytes"))
         print_result(name, result)
         
         results.append((name, result))
@@ -173,4 +580,3 @@ def main():
 
 if __name__ == "__main__":
     sys.exit(main())
-
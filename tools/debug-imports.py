@@ -9,15 +9,27 @@ Import 검증 도구
 
 사용법:
     cd stock-predictor-backend
-    python ../stock-predictor-dev-kit/tools/debug-imports.py
+    python ../stock-predictor-dev-kit/tools/debug-imports.py [--jobs N] [--no-cache] [--top N]
+    python ../stock-predictor-dev-kit/tools/debug-imports.py --profile [module] [--budget MS] [--top N]
+    
+    --jobs N:    파싱에 쓸 프로세스 수 (기본값 CPU 수, 1이면 순차)
+    --no-cache:  파일별 import 캐시를 쓰지 않고 전부 다시 파싱
+    --top N:     상위 N개 표시 (기본값 10)
+    --profile:   새 프로세스에서 `-X importtime`으로 실제 import 시간 측정 (기본 모듈 api.main)
+    --budget MS: 전체 import 시간이 MS를 넘으면 실패
 """
 
 import os
+import re
 import sys
+import json
+import subprocess
+import hashlib
 import importlib.util
 import ast
 from pathlib import Path
-from typing import List, Dict, Tuple
+from typing import List, Dict, Set, Tuple
+from concurrent.futures import ProcessPoolExecutor
 
 # 색상 (터미널용)
 RED = '\033[91m'
@@ -26,6 +38,18 @@ YELLOW = '\033[93m'
 BLUE = '\033[94m'
 RESET = '\033[0m'
 
+# 파일별 import 추출 결과 캐시 (백엔드 루트별)
+IMPORT_CACHE_FILE = Path(__file__).parent / '.import-cache.json'
+IMPORT_CACHE_VERSION = 2
+
+# 전이적 import 수 리포트 기본 개수
+FANOUT_TOP = 10
+
+# import 시간 프로파일 (python -X importtime)
+PROFILE_MODULE = 'api.main'
+PROFILE_TIMEOUT = 120
+_IMPORTTIME_RE = re.compile(r'^import time:\s+(\d+) \|\s+(\d+) \|( +)(\S.*)$')
+
 
 def find_python_files(root: Path) -> List[Path]:
     """모든 Python 파일 찾기"""
@@ -42,6 +66,18 @@ def extract_imports(file_path: Path) -> List[Dict]:
     except SyntaxError as e:
         return [{"error": f"SyntaxError: {e}", "line": e.lineno}]
     
+    # 함수 안이나 `if TYPE_CHECKING:` 아래 import는 모듈 로드 시 실행되지 않음
+    deferred = set()
+    for node in ast.walk(tree):
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            blocks = node.body
+        elif isinstance(node, ast.If) and 'TYPE_CHECKING' in ast.dump(node.test):
+            blocks = node.body
+        else:
+            continue
+        for stmt in blocks:
+            deferred.update(id(n) for n in ast.walk(stmt) if isinstance(n, (ast.Import, ast.ImportFrom)))
+    
     for node in ast.walk(tree):
         if isinstance(node, ast.Import):
             for alias in node.names:
@@ -50,7 +86,8 @@ def extract_imports(file_path: Path) -> List[Dict]:
                     "module": alias.name,
                     "alias": alias.asname,
                     "line": node.lineno,
-                    "file": str(file_path)
+                    "file": str(file_path),
+                    "deferred": id(node) in deferred
                 })
         elif isinstance(node, ast.ImportFrom):
             module = node.module or ""
@@ -60,14 +97,213 @@ def extract_imports(file_path: Path) -> List[Dict]:
                     "module": module,
                     "name": alias.name,
                     "alias": alias.asname,
+                    "level": node.level,
                     "line": node.lineno,
-                    "file": str(file_path)
+                    "file": str(file_path),
+                    "deferred": id(node) in deferred
                 })
     
     return imports
 
 
-def check_internal_import(module: str, name: str, backend_root: Path) -> Tuple[bool, str]:
+def collect_imports(py_files: List[Path], jobs: int = None) -> List[List[Dict]]:
+    """
+    파일별 import 추출 (파일 순서대로 반환)
+    
+    ast.parse가 CPU 위주라 프로세스 풀에 청크 단위로 분산
+    """
+    jobs = jobs or os.cpu_count() or 1
+    if jobs <= 1 or len(py_files) < 2:
+        return [extract_imports(f) for f in py_files]
+    
+    chunksize = max(1, len(py_files) // (jobs * 4))
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        return list(pool.map(extract_imports, py_files, chunksize=chunksize))
+
+
+def load_import_cache(root: Path) -> Dict:
+    """캐시 로드 (버전/루트가 다르거나 깨졌으면 빈 캐시)"""
+    try:
+        with open(IMPORT_CACHE_FILE, 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    
+    if cache.get("version") != IMPORT_CACHE_VERSION or cache.get("root") != str(root):
+        return {}
+    return cache.get("files", {})
+
+
+def save_import_cache(root: Path, files: Dict):
+    try:
+        with open(IMPORT_CACHE_FILE, 'w', encoding='utf-8') as f:
+            json.dump({"version": IMPORT_CACHE_VERSION, "root": str(root), "files": files}, f, ensure_ascii=False)
+    except OSError as e:
+        print(f"{YELLOW}⚠️ import 캐시 저장 실패: {e}{RESET}")
+
+
+def collect_imports_cached(py_files: List[Path], root: Path, jobs: int = None) -> Tuple[List[List[Dict]], int]:
+    """
+    캐시를 거쳐 파일별 import 추출 (파일 순서대로), (결과, 다시 파싱한 파일 수) 반환
+    
+    mtime/size가 같으면 캐시 사용, 다르면 내용 해시를 비교해 같으면 캐시 사용.
+    나머지만 파싱하고, 이번 목록에 없는 파일 항목은 캐시에서 제거
+    """
+    cache = load_import_cache(root)
+    fresh = {}
+    results = [None] * len(py_files)
+    stale = []
+    
+    for i, py_file in enumerate(py_files):
+        key = str(py_file)
+        entry = cache.get(key)
+        try:
+            stat = py_file.stat()
+            if entry and entry["mtime"] == stat.st_mtime_ns and entry["size"] == stat.st_size:
+                fresh[key] = entry
+                results[i] = entry["imports"]
+                continue
+            
+            digest = hashlib.sha1(py_file.read_bytes()).hexdigest()
+        except OSError:
+            stale.append(i)
+            continue
+        
+        if entry and entry["sha1"] == digest:
+            fresh[key] = dict(entry, mtime=stat.st_mtime_ns, size=stat.st_size)
+            results[i] = entry["imports"]
+        else:
+            fresh[key] = {"mtime": stat.st_mtime_ns, "size": stat.st_size, "sha1": digest}
+            stale.append(i)
+    
+    for i, imports in zip(stale, collect_imports([py_files[i] for i in stale], jobs)):
+        results[i] = imports
+        if str(py_files[i]) in fresh:
+            fresh[str(py_files[i])]["imports"] = imports
+    
+    save_import_cache(root, {k: v for k, v in fresh.items() if "imports" in v})
+    return results, len(stale)
+
+
+class SymbolIndex:
+    """
+    내부 모듈 심볼 테이블 (모듈당 한 번만 파싱)
+    
+    모듈 최상위의 class/def/할당/어노테이션, import로 다시 내보낸 이름,
+    __all__ 항목을 모아 `from X import Y` 검사를 dict 조회로 처리
+    """
+    
+    def __init__(self, backend_root: Path):
+        self.backend_root = backend_root
+        self._modules: Dict[str, Dict] = {}
+    
+    def module_file(self, module: str) -> Path:
+        """모듈 파일 경로 (없으면 None)"""
+        base = self.backend_root / module.replace('.', '/')
+        module_file = base.with_name(base.name + '.py')
+        if module_file.exists():
+            return module_file
+        package_init = base / '__init__.py'
+        return package_init if package_init.exists() else None
+    
+    def lookup(self, module: str) -> Dict:
+        """모듈 심볼 정보 {"file", "names", "open", "error"} (모듈이 없으면 None)"""
+        if module not in self._modules:
+            # 재귀(star import 순환) 방지용 자리 표시
+            self._modules[module] = None
+            self._modules[module] = self._build(module)
+        return self._modules[module]
+    
+    def has_submodule(self, module: str, name: str) -> bool:
+        return self.module_file(f"{module}.{name}") is not None
+    
+    def _build(self, module: str) -> Dict:
+        target_file = self.module_file(module)
+        if target_file is None:
+            return None
+        
+        info = {"file": target_file, "names": set(), "open": False, "error": None}
+        try:
+            with open(target_file, 'r', encoding='utf-8') as f:
+                tree = ast.parse(f.read(), filename=str(target_file))
+        except (OSError, SyntaxError, ValueError) as e:
+            info["error"] = str(e)
+            return info
+        
+        package = module if target_file.name == '__init__.py' else module.rpartition('.')[0]
+        self._collect(tree.body, info, package)
+        return info
+    
+    def _collect(self, body: List[ast.stmt], info: Dict, package: str):
+        names = info["names"]
+        for node in body:
+            if isinstance(node, (ast.ClassDef, ast.FunctionDef, ast.AsyncFunctionDef)):
+                names.add(node.name)
+                # 모듈 __getattr__이 있으면 어떤 이름이든 가능
+                if node.name == '__getattr__':
+                    info["open"] = True
+            elif isinstance(node, ast.Assign):
+                for target in node.targets:
+                    self._collect_target(target, names)
+                if any(isinstance(t, ast.Name) and t.id == '__all__' for t in node.targets):
+                    self._collect_all(node.value, names)
+            elif isinstance(node, (ast.AnnAssign, ast.AugAssign)):
+                self._collect_target(node.target, names)
+                if isinstance(node.target, ast.Name) and node.target.id == '__all__' and node.value:
+                    self._collect_all(node.value, names)
+            elif isinstance(node, ast.Import):
+                for alias in node.names:
+                    names.add(alias.asname or alias.name.split('.')[0])
+            elif isinstance(node, ast.ImportFrom):
+                self._collect_from(node, info, package)
+            elif isinstance(node, ast.If):
+                self._collect(node.body, info, package)
+                self._collect(node.orelse, info, package)
+            elif isinstance(node, ast.Try):
+                for block in [node.body, node.orelse, node.finalbody] + [h.body for h in node.handlers]:
+                    self._collect(block, info, package)
+            elif isinstance(node, (ast.With, ast.AsyncWith)):
+                self._collect(node.body, info, package)
+    
+    def _collect_target(self, target: ast.expr, names: set):
+        if isinstance(target, ast.Name):
+            names.add(target.id)
+        elif isinstance(target, (ast.Tuple, ast.List)):
+            for elt in target.elts:
+                self._collect_target(elt, names)
+        elif isinstance(target, ast.Starred):
+            self._collect_target(target.value, names)
+    
+    def _collect_all(self, value: ast.expr, names: set):
+        if isinstance(value, (ast.List, ast.Tuple, ast.Set)):
+            for elt in value.elts:
+                if isinstance(elt, ast.Constant) and isinstance(elt.value, str):
+                    names.add(elt.value)
+    
+    def _collect_from(self, node: ast.ImportFrom, info: Dict, package: str):
+        for alias in node.names:
+            if alias.name != '*':
+                info["names"].add(alias.asname or alias.name)
+                continue
+            
+            # star import: 내부 모듈이면 그 심볼을 따라가고, 아니면 검사 불가로 표시
+            source = node.module or ""
+            if node.level:
+                parts = package.split('.') if package else []
+                if node.level - 1 > len(parts):
+                    info["open"] = True
+                    continue
+                parts = parts[:len(parts) - (node.level - 1)]
+                source = '.'.join(parts + ([source] if source else []))
+            
+            star = self.lookup(source) if source else None
+            if star is None or star["open"] or star["error"]:
+                info["open"] = True
+            else:
+                info["names"].update(n for n in star["names"] if not n.startswith('_'))
+
+
+def check_internal_import(module: str, name: str, backend_root: Path, index: SymbolIndex = None) -> Tuple[bool, str]:
     """내부 모듈 import 검증"""
     
     # 내부 모듈만 검사 (utils, modules, core, etc.)
@@ -77,39 +313,245 @@ def check_internal_import(module: str, name: str, backend_root: Path) -> Tuple[b
     if not is_internal:
         return True, "external"
     
-    # 모듈 경로 확인
-    module_path = backend_root / module.replace('.', '/') / '__init__.py'
-    module_file = backend_root / (module.replace('.', '/') + '.py')
-    
-    if not module_path.exists() and not module_file.exists():
+    index = index or SymbolIndex(backend_root)
+    info = index.lookup(module)
+    if info is None:
         return False, f"모듈 없음: {module}"
     
-    # 모듈 파일에서 name 확인
-    target_file = module_file if module_file.exists() else module_path
+    if name == '*':
+        return True, "wildcard"
     
-    try:
-        with open(target_file, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        # 간단한 검사: class Name 또는 def name 또는 name = 
-        if name == '*':
-            return True, "wildcard"
+    if info["error"]:
+        return False, f"Error reading: {info['error']}"
+    
+    if name in info["names"]:
+        return True, "found"
+    
+    # 패키지의 하위 모듈 import (from pkg import submodule)
+    if info["file"].name == '__init__.py' and index.has_submodule(module, name):
+        return True, "submodule"
+    
+    if info["open"]:
+        return True, "dynamic"
+    
+    return False, f"'{name}' not found in {info['file'].name}"
+
+
+def module_name(file_path: Path, root: Path) -> str:
+    """파일 경로 -> 모듈 이름 (api/main.py -> api.main, utils/__init__.py -> utils)"""
+    parts = list(file_path.relative_to(root).with_suffix('').parts)
+    if parts[-1] == '__init__':
+        parts.pop()
+    return '.'.join(parts)
+
+
+def build_import_graph(py_files: List[Path], per_file: List[List[Dict]], root: Path) -> Dict[str, Set[str]]:
+    """
+    내부 모듈 의존성 그래프 {모듈: {import하는 내부 모듈}}
+    
+    모듈 로드 시 실행되는 import만 간선으로 사용 (함수 안/TYPE_CHECKING 제외)
+    """
+    modules = {module_name(f, root): f for f in py_files}
+    modules.pop('', None)
+    graph = {name: set() for name in modules}
+    
+    def resolve(name: str) -> str:
+        # import a.b.c -> 존재하는 가장 긴 내부 모듈
+        while name and name not in graph:
+            name = name.rpartition('.')[0]
+        return name
+    
+    for py_file, imports in zip(py_files, per_file):
+        source = module_name(py_file, root)
+        if source not in graph:
+            continue
+        package = source if py_file.name == '__init__.py' else source.rpartition('.')[0]
         
-        patterns = [
-            f'class {name}',
-            f'def {name}',
-            f'{name} = ',
-            f'{name}:',
-        ]
+        for imp in imports:
+            if "error" in imp or imp.get("deferred"):
+                continue
+            
+            target = imp["module"]
+            if imp["type"] == "from" and imp.get("level"):
+                parts = package.split('.') if package else []
+                if imp["level"] - 1 > len(parts):
+                    continue
+                parts = parts[:len(parts) - (imp["level"] - 1)]
+                target = '.'.join(parts + ([target] if target else []))
+            
+            # from pkg import submodule -> 하위 모듈로 간선
+            if imp["type"] == "from" and f"{target}.{imp['name']}" in graph:
+                target = f"{target}.{imp['name']}"
+            
+            # 하위 모듈을 import하면 상위 패키지 __init__도 함께 로드됨
+            # (자기 자신/자기 상위 패키지는 이미 로드 중이므로 간선 아님)
+            target = resolve(target)
+            while target:
+                if target != source and not source.startswith(target + '.'):
+                    graph[source].add(target)
+                target = resolve(target.rpartition('.')[0])
+    
+    return graph
+
+
+def strongly_connected_components(graph: Dict[str, Set[str]]) -> List[List[str]]:
+    """
+    Tarjan SCC (재귀 한도를 피하려고 반복문으로 구현)
+    
+    역위상 순서(다른 SCC에 의존하지 않는 것부터)로 반환
+    """
+    index = {}
+    lowlink = {}
+    on_stack = set()
+    stack = []
+    sccs = []
+    counter = 0
+    
+    for start in graph:
+        if start in index:
+            continue
         
-        for pattern in patterns:
-            if pattern in content:
-                return True, "found"
+        index[start] = lowlink[start] = counter
+        counter += 1
+        stack.append(start)
+        on_stack.add(start)
+        work = [(start, iter(sorted(graph[start])))]
         
-        return False, f"'{name}' not found in {target_file.name}"
+        while work:
+            node, successors = work[-1]
+            for succ in successors:
+                if succ not in index:
+                    index[succ] = lowlink[succ] = counter
+                    counter += 1
+                    stack.append(succ)
+                    on_stack.add(succ)
+                    work.append((succ, iter(sorted(graph[succ]))))
+                    break
+                if succ in on_stack:
+                    lowlink[node] = min(lowlink[node], index[succ])
+            else:
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    lowlink[parent] = min(lowlink[parent], lowlink[node])
+                if lowlink[node] == index[node]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        component.append(member)
+                        if member == node:
+                            break
+                    sccs.append(sorted(component))
+    
+    return sccs
+
+
+def find_cycles(sccs: List[List[str]]) -> List[List[str]]:
+    """순환 import (크기 2 이상 SCC)"""
+    return [c for c in sccs if len(c) > 1]
+
+
+def transitive_fanout(graph: Dict[str, Set[str]], sccs: List[List[str]]) -> Dict[str, int]:
+    """
+    모듈별 전이적으로 로드되는 내부 모듈 수 (자기 자신 제외)
+    
+    SCC 축약 그래프를 역위상 순서로 돌며 도달 집합을 한 번씩만 계산
+    """
+    component_of = {m: i for i, c in enumerate(sccs) for m in c}
+    reach = []
+    for i, component in enumerate(sccs):
+        reached = set(component)
+        for member in component:
+            for succ in graph[member]:
+                j = component_of[succ]
+                if j != i:
+                    reached |= reach[j]
+        reach.append(reached)
+    
+    return {m: len(reach[component_of[m]]) - 1 for m in graph}
+
+
+def parse_importtime(output: str) -> List[Dict]:
+    """
+    `-X importtime` 출력 -> import 트리 (최상위 노드 목록, 출력 순서대로)
+    
+    자식이 부모보다 먼저 출력되므로, 한 단계 깊은 대기 노드들을 부모의 자식으로 붙임
+    """
+    pending: Dict[int, List[Dict]] = {}
+    for line in output.splitlines():
+        match = _IMPORTTIME_RE.match(line)
+        if not match:
+            continue
         
-    except Exception as e:
-        return False, f"Error reading: {e}"
+        depth = (len(match.group(3)) - 1) // 2
+        node = {
+            "name": match.group(4).strip(),
+            "self_us": int(match.group(1)),
+            "cumulative_us": int(match.group(2)),
+            "children": pending.pop(depth + 1, []),
+        }
+        pending.setdefault(depth, []).append(node)
+    
+    return pending.get(0, [])
+
+
+def flatten_import_tree(root: Dict) -> List[Tuple[Dict, List[str]]]:
+    """트리 -> [(노드, root부터의 import 체인)]"""
+    flat = []
+    stack = [(root, [root["name"]])]
+    while stack:
+        node, chain = stack.pop()
+        flat.append((node, chain))
+        for child in node["children"]:
+            stack.append((child, chain + [child["name"]]))
+    return flat
+
+
+def profile_imports(module: str, backend_root: Path, top: int, budget_ms: float = None) -> int:
+    """새 프로세스에서 module import 시간을 측정해 출력, 실패(import 오류/예산 초과) 시 1 반환"""
+    print(f"⏱️ Import 시간 측정: {module}\n")
+    
+    try:
+        proc = subprocess.run(
+            [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+            cwd=backend_root, capture_output=True, text=True, timeout=PROFILE_TIMEOUT
+        )
+    except subprocess.TimeoutExpired:
+        print(f"{RED}❌ {PROFILE_TIMEOUT}초 안에 import가 끝나지 않았습니다.{RESET}")
+        return 1
+    
+    if proc.returncode != 0:
+        print(f"{RED}❌ import 실패: {module}{RESET}")
+        for line in [l for l in proc.stderr.splitlines() if not l.startswith('import time:')][-15:]:
+            print(f"      {line}")
+        return 1
+    
+    # 인터프리터 시작 시 import는 제외하고, 대상 모듈 import 트리만 사용
+    roots = [r for r in parse_importtime(proc.stderr) if r["name"] == module]
+    if not roots:
+        print(f"{YELLOW}⚠️ importtime 출력에서 {module}을 찾지 못했습니다.{RESET}")
+        return 1
+    
+    root = roots[-1]
+    total_ms = root["cumulative_us"] / 1000
+    flat = flatten_import_tree(root)
+    
+    print(f"📦 로드된 모듈: {len(flat)}개")
+    print(f"⏱️ 전체 import 시간: {total_ms:.1f}ms\n")
+    
+    print(f"{BLUE}🐢 self 시간 상위 {min(top, len(flat))}개{RESET}\n")
+    for node, chain in sorted(flat, key=lambda item: -item[0]["self_us"])[:top]:
+        print(f"   {node['self_us'] / 1000:>8.1f}ms self  {node['cumulative_us'] / 1000:>8.1f}ms cum  {node['name']}")
+        print(f"      {' → '.join(chain)}")
+    
+    if budget_ms is not None:
+        if total_ms > budget_ms:
+            print(f"\n{RED}❌ 예산 초과: {total_ms:.1f}ms > {budget_ms:.1f}ms{RESET}")
+            return 1
+        print(f"\n{GREEN}✅ 예산 이내: {total_ms:.1f}ms <= {budget_ms:.1f}ms{RESET}")
+    
+    return 0
 
 
 def main():
@@ -126,6 +568,14 @@ def main():
     
     print(f"📂 검사 대상: {backend_root}\n")
     
+    top = int(sys.argv[sys.argv.index('--top') + 1]) if '--top' in sys.argv else FANOUT_TOP
+    
+    if '--profile' in sys.argv:
+        i = sys.argv.index('--profile') + 1
+        module = sys.argv[i] if i < len(sys.argv) and not sys.argv[i].startswith('--') else PROFILE_MODULE
+        budget_ms = float(sys.argv[sys.argv.index('--budget') + 1]) if '--budget' in sys.argv else None
+        return profile_imports(module, backend_root, top, budget_ms)
+    
     # 모든 Python 파일 찾기
     py_files = find_python_files(backend_root)
     
@@ -140,9 +590,15 @@ def main():
     print(f"📄 Python 파일: {len(py_files)}개\n")
     
     # 모든 import 수집
+    jobs = int(sys.argv[sys.argv.index('--jobs') + 1]) if '--jobs' in sys.argv else None
+    if '--no-cache' in sys.argv:
+        per_file = collect_imports(py_files, jobs)
+    else:
+        per_file, parsed = collect_imports_cached(py_files, backend_root, jobs)
+        print(f"♻️ 캐시: {len(py_files) - parsed}개 재사용, {parsed}개 파싱\n")
+    
     all_imports = []
-    for py_file in py_files:
-        imports = extract_imports(py_file)
+    for imports in per_file:
         all_imports.extend(imports)
     
     print(f"🔍 Import 문: {len(all_imports)}개\n")
@@ -151,6 +607,7 @@ def main():
     errors = []
     warnings = []
     checked = 0
+    index = SymbolIndex(backend_root)
     
     for imp in all_imports:
         if "error" in imp:
@@ -164,7 +621,7 @@ def main():
             # 내부 모듈만 검사
             if any(module.startswith(p) for p in ['utils.', 'modules.', 'core.', 'api.', 'screening.', 'data_providers.', 'data_storage.', 'analysis_engines.']):
                 checked += 1
-                ok, reason = check_internal_import(module, name, backend_root)
+                ok, reason = check_internal_import(module, name, backend_root, index)
                 
                 if not ok:
                     errors.append({
@@ -177,6 +634,15 @@ def main():
     
     print(f"✅ 내부 Import 검사: {checked}개\n")
     
+    # 의존성 그래프 / 순환 import / 전이적 import 수
+    graph = build_import_graph(py_files, per_file, backend_root)
+    sccs = strongly_connected_components(graph)
+    for cycle in find_cycles(sccs):
+        warnings.append(cycle)
+    fanout = transitive_fanout(graph, sccs)
+    
+    print(f"🕸️ 의존성 그래프: 모듈 {len(graph)}개, 간선 {sum(len(v) for v in graph.values())}개\n")
+    
     # 결과 출력
     if errors:
         print(f"{RED}{'='*50}{RESET}")
@@ -197,11 +663,24 @@ def main():
         print(f"{GREEN}    ✅ 모든 내부 Import 정상!{RESET}")
         print(f"{GREEN}{'='*50}{RESET}")
     
+    if warnings:
+        print(f"\n{YELLOW}⚠️ 순환 import: {len(warnings)}개{RESET}\n")
+        for cycle in warnings:
+            print(f"  {YELLOW}Cycle{RESET} ({len(cycle)}개 모듈)")
+            print(f"      {' ↔ '.join(cycle)}\n")
+    
+    ranked = sorted((kv for kv in fanout.items() if kv[1]), key=lambda kv: (-kv[1], kv[0]))[:top]
+    if ranked:
+        print(f"\n{BLUE}📦 전이적 import 상위 {len(ranked)}개 (콜드 스타트 비용){RESET}\n")
+        for name, count in ranked:
+            print(f"   {count:>5}개  ← {name} (직접 {len(graph[name])}개)")
+    
     # 요약
     print(f"\n📊 요약:")
     print(f"   - 검사한 파일: {len(py_files)}개")
     print(f"   - 검사한 Import: {checked}개")
     print(f"   - 오류: {len(errors)}개")
+    print(f"   - 순환 import: {len(warnings)}개")
     
     return len(errors)
 
@@ -12,18 +12,43 @@
 
 사용법:
     cd stock-predictor-dev-kit
-    python tools/full-check.py [--local | --prod]
+    python tools/full-check.py [--local | --prod] [--jobs N] [--no-cache] [--quiet] [--changed]
+                               [--shards N]
+    python tools/full-check.py --report [N] [--local | --prod] [--shards N] [--changed]
     
-    --local: 로컬 환경 검사 (기본값)
-    --prod:  프로덕션 환경 검사
+    --local:    로컬 환경 검사 (기본값)
+    --prod:     프로덕션 환경 검사 (API 지연시간 SLO 검사 포함)
+    --jobs N:   동시에 실행할 검사 수 (기본값 4, 1이면 순차 실행)
+    --no-cache: 입력이 그대로여도 캐시된 통과 결과를 쓰지 않고 모두 다시 실행
+    --quiet:    빌드/테스트 출력을 실시간으로 보여주지 않음
+    --changed:  마지막 테스트 통과 이후 바뀐 모듈을 import하는 테스트만 실행
+    --shards N: Backend 테스트를 과거 소요 시간 기준으로 N개로 나눠 동시에 실행
+    --report N: 검사를 실행하지 않고 같은 설정(모드/분할/--changed)의 최근 N회(기본값 10)
+                기록에서 느려진 검사 출력, 느려진 검사가 있으면 종료 코드 1
 """
 
 import os
 import sys
+import ast
+import signal
 import subprocess
+import re
 import json
+import time
+import hashlib
+import threading
+import tempfile
+import importlib.util
+import xml.etree.ElementTree as ET
 from pathlib import Path
 from datetime import datetime
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+try:
+    import resource  # Unix 전용: 자식 프로세스 CPU 시간/최대 RSS
+except ImportError:
+    resource = None
 
 # 색상
 RED = '\033[91m'
@@ -34,20 +59,82 @@ CYAN = '\033[96m'
 RESET = '\033[0m'
 BOLD = '\033[1m'
 
+# 동시 실행 기본 검사 수
+DEFAULT_JOBS = 4
+
+# 명령 출력 중 보관할 마지막 줄 수 (실패 상세용)
+OUTPUT_TAIL_LINES = 200
+
+# 검사 기록: 최근 HISTORY_LIMIT회만 유지, --report 기본 비교 횟수와 느려짐 기준
+HISTORY_LIMIT = 100
+REPORT_RUNS = 10
+SLOWDOWN_THRESHOLD = 1.2
+SLOWDOWN_MIN_SECONDS = 1.0  # 이보다 작은 차이는 무시 (짧은 검사의 잡음)
+
+# --shards 모드: 기록 없는 테스트의 예상 시간(초), 명령줄 길이 한도 (넘으면 파일 단위로 분할)
+DEFAULT_TEST_SECONDS = 0.1
+MAX_SHARD_ARGS_CHARS = 24000
+
+# --changed 모드: 바뀌어도 테스트 선택에 영향 없는 파일
+INCREMENTAL_IGNORE_SUFFIXES = {'.md', '.rst', '.pyc'}
+
+# 지문 계산 시 건너뛸 디렉토리 (git 저장소가 아닐 때)
+FINGERPRINT_SKIP_DIRS = {'.git', 'node_modules', 'venv', '.venv', '__pycache__', 'dist', '.next',
+                         '.pytest_cache', '.mypy_cache'}
+
 
 class SystemChecker:
     """종합 시스템 검사기"""
     
-    def __init__(self, mode: str = 'local'):
+    # 검사 목록: 이름 -> (메서드, 먼저 끝나야 하는 검사, 입력 소스). 선언 순서가 결과 순서
+    # 입력 소스가 있는 검사는 입력 지문이 마지막 통과 때와 같으면 캐시 결과 재사용.
+    # 'tool:파일명'은 검사가 실행하는 tools/ 스크립트 (검사 기준이 바뀌면 캐시 무효화)
+    CHECKS = {
+        'dependencies': ('check_dependencies', [], []),
+        'git': ('check_git_status', [], []),
+        'imports': ('check_imports', [], ['backend', 'tool:debug-imports.py']),
+        'typescript': ('check_typescript', [], ['frontend']),
+        'build': ('check_build', ['typescript'], ['frontend']),
+        'tests': ('check_tests', [], ['backend']),
+        'api': ('check_api_health', [], []),
+        'api_slo': ('check_api_slo', ['api'], []),
+    }
+    
+    def __init__(self, mode: str = 'local', jobs: int = DEFAULT_JOBS, use_cache: bool = True,
+                 stream: bool = True, incremental: bool = False, shards: int = 1):
         self.mode = mode
+        self.jobs = max(1, jobs)
+        self.use_cache = use_cache
+        self.stream = stream
+        self.incremental = incremental
+        self.shards = max(1, shards)
         self.results = []
         self.start_time = datetime.now()
         
+        # 실행 시작 시점의 backend (커밋, 커밋되지 않은 경로), run()에서 채움
+        self.backend_start = (None, [])
+        
+        # 검사별 시간/자원 사용량 (이름 -> start, end, duration, cpu_seconds, max_rss_kb)
+        self.timings = {}
+        
+        # 검사별 캐시 적중/미스 (이름 -> 'hit' | 'miss')
+        self.cache_status = {}
+        self._fingerprints = {}
+        self._cache_lock = threading.Lock()
+        
+        # 동시 실행 시 검사별 로그/결과는 스레드 로컬 버퍼에 모았다가 한 번에 출력
+        self._local = threading.local()
+        self._print_lock = threading.Lock()
+        
         # 경로 설정
         self.dev_kit_root = Path(__file__).parent.parent
         self.project_root = self.dev_kit_root.parent
         self.backend_root = self.project_root / 'stock-predictor-backend'
         self.frontend_root = self.project_root / 'stock-predictor-frontend'
+        self.cache_file = self.dev_kit_root / 'tools' / '.check-cache.json'
+        self.history_file = self.dev_kit_root / 'tools' / '.check-history.jsonl'
+        self.durations_file = self.dev_kit_root / 'tools' / '.test-durations.json'
+        self.check_cache = self._load_check_cache()
         
         # 배포 URL
         self.prod_backend_url = "https://web-production-805a.up.railway.app"
@@ -62,28 +149,129 @@ class SystemChecker:
             'error': RED,
             'header': BLUE + BOLD
         }
-        print(f"{colors.get(level, '')}{message}{RESET}")
+        line = f"{colors.get(level, '')}{message}{RESET}"
+        
+        buffer = getattr(self._local, 'log', None)
+        if buffer is not None:
+            buffer.append(line)
+        else:
+            with self._print_lock:
+                print(line)
     
-    def run_command(self, cmd: list, cwd: Path = None, timeout: int = 300) -> tuple:
-        """명령 실행"""
+    def run_command(self, cmd: list, cwd: Path = None, timeout: int = 300, stream: bool = False,
+                    tail_lines: int = OUTPUT_TAIL_LINES) -> tuple:
+        """
+        명령 실행
+        
+        출력은 줄 단위로 읽어 마지막 tail_lines줄만 보관하고 (None이면 전부),
+        stream=True면 현재 검사 이름을 붙여 바로 출력.
+        타임아웃 시 자식 프로세스까지 프로세스 그룹 전체를 종료
+        """
+        if os.name == 'nt':
+            group = {'creationflags': subprocess.CREATE_NEW_PROCESS_GROUP}
+        else:
+            group = {'start_new_session': True}
+        
         try:
-            result = subprocess.run(
+            process = subprocess.Popen(
                 cmd,
                 cwd=cwd,
-                capture_output=True,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
                 text=True,
-                timeout=timeout,
-                shell=(os.name == 'nt')  # Windows에서는 shell=True
+                errors='replace',
+                shell=(os.name == 'nt'),  # Windows에서는 shell=True
+                **group
             )
-            return result.returncode == 0, result.stdout, result.stderr
-        except subprocess.TimeoutExpired:
-            return False, "", "Timeout"
         except Exception as e:
             return False, "", str(e)
+        
+        prefix = getattr(self._local, 'check', None) if stream and self.stream else None
+        stdout_tail = deque(maxlen=tail_lines)
+        stderr_tail = deque(maxlen=tail_lines)
+        readers = [
+            threading.Thread(target=self._read_output, args=(process.stdout, stdout_tail, prefix), daemon=True),
+            threading.Thread(target=self._read_output, args=(process.stderr, stderr_tail, prefix), daemon=True),
+        ]
+        for reader in readers:
+            reader.start()
+        
+        timed_out = not self._wait_process(process, timeout)
+        
+        for reader in readers:
+            reader.join(timeout=5)
+        
+        if timed_out:
+            return False, "".join(stdout_tail), "Timeout"
+        return process.returncode == 0, "".join(stdout_tail), "".join(stderr_tail)
+    
+    def _wait_process(self, process: subprocess.Popen, timeout: int) -> bool:
+        """
+        프로세스 종료 대기 (타임아웃이면 프로세스 그룹 종료 후 False)
+        
+        Unix에서는 os.wait4로 회수해 CPU 시간/최대 RSS를 현재 검사에 합산
+        """
+        if resource is None:
+            try:
+                process.wait(timeout=timeout)
+                return True
+            except subprocess.TimeoutExpired:
+                self._kill_process_group(process)
+                process.wait()
+                return False
+        
+        reaped = {}
+        
+        def reap():
+            _, status, usage = os.wait4(process.pid, 0)
+            reaped['status'], reaped['usage'] = status, usage
+        
+        waiter = threading.Thread(target=reap, daemon=True)
+        waiter.start()
+        waiter.join(timeout)
+        
+        finished = not waiter.is_alive()
+        if not finished:
+            self._kill_process_group(process)
+            waiter.join()
+        
+        process.returncode = os.waitstatus_to_exitcode(reaped['status'])
+        
+        usage = getattr(self._local, 'usage', None)
+        if usage is not None:
+            usage['cpu_seconds'] += reaped['usage'].ru_utime + reaped['usage'].ru_stime
+            # ru_maxrss: Linux는 KB, macOS는 바이트
+            rss_kb = reaped['usage'].ru_maxrss // (1024 if sys.platform == 'darwin' else 1)
+            usage['max_rss_kb'] = max(usage['max_rss_kb'], rss_kb)
+        
+        return finished
+    
+    def _read_output(self, pipe, tail: deque, prefix: str = None):
+        """파이프를 줄 단위로 읽어 tail에 보관 (prefix가 있으면 바로 출력)"""
+        with pipe:
+            for line in pipe:
+                tail.append(line)
+                if prefix:
+                    with self._print_lock:
+                        print(f"{CYAN}  │ [{prefix}]{RESET} {line.rstrip()}")
+    
+    @staticmethod
+    def _kill_process_group(process: subprocess.Popen):
+        """프로세스와 그 자식들 종료"""
+        try:
+            if os.name == 'nt':
+                subprocess.run(['taskkill', '/F', '/T', '/PID', str(process.pid)], capture_output=True)
+            else:
+                os.killpg(process.pid, signal.SIGKILL)
+        except (OSError, subprocess.SubprocessError):
+            process.kill()
     
     def add_result(self, name: str, passed: bool, details: str = ""):
         """결과 추가"""
-        self.results.append({
+        results = getattr(self._local, 'results', None)
+        if results is None:
+            results = self.results
+        results.append({
             'name': name,
             'passed': passed,
             'details': details,
@@ -135,12 +323,16 @@ class SystemChecker:
             cwd=self.backend_root
         )
         
-        if "모든 내부 Import 정상" in stdout:
+        # debug-imports.py는 오류가 있으면 exit 1 (출력은 마지막 일부만 남으므로 배너 대신 종료 코드로 판정)
+        if success:
             self.add_result("Import 검증", True)
         else:
-            # 오류 개수 추출
-            error_count = stdout.count("ImportError")
-            self.add_result("Import 검증", False, f"{error_count}개 오류 발견")
+            # 오류 개수 추출 (마지막 요약 줄)
+            match = re.search(r"- 오류: (\d+)개", stdout)
+            if match:
+                self.add_result("Import 검증", False, f"{match.group(1)}개 오류 발견")
+            else:
+                self.add_result("Import 검증", False, stderr[-200:] or "debug-imports.py 실패")
     
     def check_typescript(self):
         """TypeScript 타입 검사"""
@@ -160,7 +352,8 @@ class SystemChecker:
         success, stdout, stderr = self.run_command(
             ['npm', 'run', 'type-check'] if os.name != 'nt' else ['npm.cmd', 'run', 'type-check'],
             cwd=self.frontend_root,
-            timeout=120
+            timeout=120,
+            stream=True
         )
         
         if success:
@@ -172,7 +365,8 @@ class SystemChecker:
                 success, stdout, stderr = self.run_command(
                     ['npx', 'tsc', '--noEmit'] if os.name != 'nt' else ['npx.cmd', 'tsc', '--noEmit'],
                     cwd=self.frontend_root,
-                    timeout=120
+                    timeout=120,
+                    stream=True
                 )
                 if success or "error TS" not in stderr:
                     self.add_result("TypeScript 검사", True)
@@ -191,7 +385,8 @@ class SystemChecker:
             success, stdout, stderr = self.run_command(
                 ['npm', 'run', 'build'] if os.name != 'nt' else ['npm.cmd', 'run', 'build'],
                 cwd=self.frontend_root,
-                timeout=180
+                timeout=180,
+                stream=True
             )
             
             if success or "built in" in stdout:
@@ -207,11 +402,30 @@ class SystemChecker:
             self.add_result("Backend 테스트", False, "디렉토리 없음")
             return
         
+        # 변경분 테스트 선택 (불확실하면 None → 전체 실행)
+        selected = None
+        if self.incremental:
+            selected = self.select_tests()
+            # 일부만 실행한 결과는 전체 통과로 캐시하지 않음
+            self._local.partial = selected is not None
+            if selected is None:
+                self.log("  변경 범위를 확정할 수 없어 전체 테스트 실행", 'warning')
+            elif not selected:
+                self.add_result("Backend 테스트", True, "변경된 모듈과 관련된 테스트 없음")
+                return
+            else:
+                self.log(f"  변경 관련 테스트 파일 {len(selected)}개만 실행")
+        
+        if self.shards > 1:
+            self.run_sharded_tests(selected or [])
+            return
+        
         # pytest 실행
         success, stdout, stderr = self.run_command(
-            [sys.executable, '-m', 'pytest', '--tb=no', '-q'],
+            [sys.executable, '-m', 'pytest', '--tb=no', '-q'] + (selected or []),
             cwd=self.backend_root,
-            timeout=300
+            timeout=300,
+            stream=True
         )
         
         if success:
@@ -227,6 +441,318 @@ class SystemChecker:
             else:
                 self.add_result("Backend 테스트", False, stderr[:200])
     
+    # ========================================
+    # 테스트 분할 실행 (--shards)
+    # ========================================
+    
+    def collect_tests(self, paths: list) -> list:
+        """pytest --collect-only로 테스트 ID 수집 (실패 시 None)"""
+        success, stdout, _ = self.run_command(
+            [sys.executable, '-m', 'pytest', '--collect-only', '-q'] + paths,
+            cwd=self.backend_root,
+            timeout=120,
+            tail_lines=None
+        )
+        if not success:
+            return None
+        return [line.strip() for line in stdout.splitlines() if '::' in line]
+    
+    def _load_durations(self) -> dict:
+        if not self.durations_file.exists():
+            return {}
+        try:
+            with open(self.durations_file, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+    
+    def plan_shards(self, test_ids: list, durations: dict) -> list:
+        """
+        테스트를 shards개로 분할 (긴 테스트부터 가장 가벼운 샤드에 배정)
+        
+        ID를 모두 넘기면 명령줄이 너무 길어질 때는 파일 단위로 분할
+        """
+        known = sorted(durations[t] for t in test_ids if t in durations)
+        default = known[len(known) // 2] if known else DEFAULT_TEST_SECONDS
+        
+        units = {}
+        by_file = sum(len(t) + 1 for t in test_ids) > MAX_SHARD_ARGS_CHARS
+        for test_id in test_ids:
+            unit = test_id.split('::')[0] if by_file else test_id
+            units[unit] = units.get(unit, 0.0) + durations.get(test_id, default)
+        
+        count = min(self.shards, len(units))
+        shards = [[] for _ in range(count)]
+        loads = [0.0] * count
+        for unit, seconds in sorted(units.items(), key=lambda item: (-item[1], item[0])):
+            i = loads.index(min(loads))
+            shards[i].append(unit)
+            loads[i] += seconds
+        return shards
+    
+    def _run_shard(self, index: int, args: list, report: Path, usage: dict) -> tuple:
+        """샤드 하나 실행 (별도 스레드, 출력 prefix는 tests#N)"""
+        self._local.check = f"tests#{index + 1}"
+        self._local.usage = {'cpu_seconds': 0.0, 'max_rss_kb': 0} if usage is not None else None
+        try:
+            return self.run_command(
+                [sys.executable, '-m', 'pytest', '--tb=no', '-q', '-p', 'no:cacheprovider',
+                 '-o', 'junit_family=xunit1', f'--junitxml={report}'] + args,
+                cwd=self.backend_root,
+                timeout=300,
+                stream=True
+            )
+        finally:
+            if usage is not None:
+                with self._cache_lock:
+                    usage['cpu_seconds'] += self._local.usage['cpu_seconds']
+                    usage['max_rss_kb'] = max(usage['max_rss_kb'], self._local.usage['max_rss_kb'])
+            self._local.check = None
+            self._local.usage = None
+    
+    @staticmethod
+    def _parse_junit(report: Path) -> tuple:
+        """junit XML -> ({테스트 ID: 초}, 실패한 테스트 ID 목록, 건너뛴 수)"""
+        durations, failed, skipped = {}, [], 0
+        for case in ET.parse(report).getroot().iter('testcase'):
+            file = case.get('file') or ''
+            module = file[:-3].replace('/', '.').replace('\\', '.')
+            classname = case.get('classname') or ''
+            rest = classname[len(module) + 1:] if classname.startswith(module) else ''
+            test_id = '::'.join([file] + ([*rest.split('.')] if rest else []) + [case.get('name', '')])
+            
+            durations[test_id] = float(case.get('time') or 0)
+            if case.find('failure') is not None or case.find('error') is not None:
+                failed.append(test_id)
+            elif case.find('skipped') is not None:
+                skipped += 1
+        return durations, failed, skipped
+    
+    def run_sharded_tests(self, paths: list):
+        """테스트를 샤드로 나눠 동시에 실행하고 결과를 add_result 하나로 합침"""
+        test_ids = self.collect_tests(paths)
+        if test_ids is None:
+            self.add_result("Backend 테스트", False, "테스트 수집 실패")
+            return
+        if not test_ids:
+            self.add_result("Backend 테스트", True, "수집된 테스트 없음")
+            return
+        
+        durations = self._load_durations()
+        shards = self.plan_shards(test_ids, durations)
+        self.log(f"  테스트 {len(test_ids)}개를 {len(shards)}개 샤드로 분할 실행")
+        
+        usage = self._local.usage
+        with tempfile.TemporaryDirectory(prefix='full-check-shards-') as tmp:
+            reports = [Path(tmp) / f'shard-{i}.xml' for i in range(len(shards))]
+            with ThreadPoolExecutor(max_workers=len(shards)) as pool:
+                outcomes = list(pool.map(self._run_shard, range(len(shards)), shards, reports,
+                                         [usage] * len(shards)))
+            
+            passed, failed, skipped, errors = 0, [], 0, []
+            for i, (report, (success, stdout, stderr)) in enumerate(zip(reports, outcomes)):
+                try:
+                    shard_durations, shard_failed, shard_skipped = self._parse_junit(report)
+                except (OSError, ET.ParseError):
+                    errors.append(f"샤드 {i + 1}: {(stderr or stdout).strip()[-200:] or '결과 없음'}")
+                    continue
+                durations.update(shard_durations)
+                failed.extend(shard_failed)
+                skipped += shard_skipped
+                passed += len(shard_durations) - len(shard_failed) - shard_skipped
+                if not success and not shard_failed:
+                    errors.append(f"샤드 {i + 1}: {stderr.strip()[-200:] or '비정상 종료'}")
+        
+        try:
+            with open(self.durations_file, 'w', encoding='utf-8') as f:
+                json.dump(durations, f, indent=2, ensure_ascii=False)
+        except OSError as e:
+            self.log(f"⚠️ 테스트 시간 기록 저장 실패: {e}", 'warning')
+        
+        summary = f"{passed} passed, {len(failed)} failed, {skipped} skipped ({len(shards)} shards)"
+        if failed or errors:
+            details = [summary] + [f"FAILED {test_id}" for test_id in failed] + errors
+            self.add_result("Backend 테스트", False, '\n'.join(details))
+        else:
+            self.add_result("Backend 테스트", True, summary)
+    
+    def _load_tool(self, filename: str):
+        """tools/ 아래 스크립트를 모듈로 로드 (파일명에 '-'가 있어 import 불가)"""
+        path = self.dev_kit_root / 'tools' / filename
+        spec = importlib.util.spec_from_file_location(filename.replace('-', '_')[:-3], path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        return module
+    
+    def last_passing_state(self) -> tuple:
+        """
+        기록에서 Backend 테스트가 통과한 마지막 실행의 (backend 커밋, 그때 수정돼 있던 경로)
+        
+        수정된 경로 기록이 없는 (이전 형식) 실행은 작업 트리 상태를 알 수 없어 건너뜀
+        """
+        for run in reversed(self.load_history()):
+            tests = run.get('checks', {}).get('tests', {})
+            if tests.get('passed') and run.get('backend_commit') and 'backend_dirty' in run:
+                return run['backend_commit'], run['backend_dirty']
+        return None, []
+    
+    def changed_backend_files(self, base: str) -> list:
+        """
+        base 커밋 이후 바뀐 backend 파일 (커밋 + 작업 트리 + 추적 안 된 파일), 실패 시 None
+        
+        이름이 바뀐 파일은 이전 경로도 포함 (삭제된 모듈 감지용)
+        """
+        success, diff, _ = self.run_command(
+            ['git', 'diff', '--name-status', '-z', base], cwd=self.backend_root
+        )
+        if not success:
+            return None
+        _, status, _ = self.run_command(
+            ['git', 'status', '--porcelain', '-z', '--untracked-files=all'], cwd=self.backend_root
+        )
+        
+        # --name-status -z: 상태\0경로\0 (이름 변경/복사는 상태\0이전\0새 경로\0)
+        changed = set()
+        fields = diff.split('\0')
+        i = 0
+        while i < len(fields):
+            code = fields[i]
+            count = 2 if code[:1] in ('R', 'C') else 1
+            changed.update(f for f in fields[i + 1:i + 1 + count] if f)
+            i += 1 + count
+        
+        for _, path, orig in self._parse_porcelain(status):
+            changed.add(path)
+            if orig:
+                changed.add(orig)
+        return sorted(changed)
+    
+    def select_tests(self) -> list:
+        """
+        마지막 통과 커밋 이후 바뀐 모듈 (그 실행 때 수정돼 있던 파일 포함)을
+        (직접/간접) import하는 테스트 파일 목록
+        
+        import 추출은 debug-imports.py의 extract_imports를 그대로 사용.
+        기준 커밋이 없거나, Python 외 파일/conftest.py가 바뀌었거나,
+        삭제/이름 변경된 모듈이 있거나, 파싱할 수 없는 파일이 있거나,
+        conftest.py/pytest_plugins 모듈이 영향을 받으면 None (전체 실행)
+        """
+        base, base_dirty = self.last_passing_state()
+        if not base:
+            return None
+        
+        changed = self.changed_backend_files(base)
+        if changed is None:
+            return None
+        
+        # 기준 실행 때 커밋되지 않았던 파일은 지금 base와 같아도 검증된 적이 없음
+        changed = sorted(set(changed) | set(base_dirty))
+        
+        changed_modules = set()
+        for path in changed:
+            suffix = Path(path).suffix
+            if suffix in INCREMENTAL_IGNORE_SUFFIXES or FINGERPRINT_SKIP_DIRS.intersection(Path(path).parts):
+                continue
+            if suffix != '.py' or Path(path).name == 'conftest.py':
+                return None
+            # 삭제되거나 이름이 바뀐 모듈은 import하던 쪽을 그래프로 찾을 수 없음
+            if not (self.backend_root / path).exists():
+                return None
+            changed_modules.add(self._module_name(Path(path)))
+        
+        if not changed_modules:
+            return []
+        
+        extract_imports = self._load_tool('debug-imports.py').extract_imports
+        
+        files = {}
+        for path in self.backend_root.rglob('*.py'):
+            rel = path.relative_to(self.backend_root)
+            if FINGERPRINT_SKIP_DIRS.intersection(rel.parts):
+                continue
+            files[self._module_name(rel)] = rel
+        
+        # 역방향 import 그래프: 모듈 -> 그 모듈을 import하는 모듈들
+        importers = {}
+        plugins = set()
+        for module, rel in files.items():
+            for imp in extract_imports(self.backend_root / rel):
+                if "error" in imp:
+                    return None
+                for target in self._resolve_import(imp, files):
+                    importers.setdefault(target, set()).add(module)
+            if rel.name == 'conftest.py':
+                plugins.update(self._pytest_plugins(self.backend_root / rel))
+        
+        # 바뀐 모듈에서 시작해 import하는 쪽으로 전파
+        affected = set(changed_modules)
+        queue = list(changed_modules)
+        while queue:
+            for importer in importers.get(queue.pop(), ()):
+                if importer not in affected:
+                    affected.add(importer)
+                    queue.append(importer)
+        
+        # fixture로만 닿는 테스트는 import 그래프로 알 수 없음
+        if any(files[m].name == 'conftest.py' for m in affected if m in files) or plugins & affected:
+            return None
+        
+        return sorted(
+            str(files[module]) for module in affected
+            if module in files and self._is_test_file(files[module])
+        )
+    
+    @staticmethod
+    def _module_name(rel: Path) -> str:
+        parts = list(rel.with_suffix('').parts)
+        if parts and parts[-1] == '__init__':
+            parts.pop()
+        return '.'.join(parts)
+    
+    @staticmethod
+    def _pytest_plugins(conftest: Path) -> set:
+        """conftest.py의 pytest_plugins에 적힌 모듈 이름"""
+        try:
+            tree = ast.parse(conftest.read_text(encoding='utf-8'))
+        except (OSError, SyntaxError, ValueError):
+            return set()
+        
+        plugins = set()
+        for node in tree.body:
+            if isinstance(node, ast.Assign) and any(
+                isinstance(t, ast.Name) and t.id == 'pytest_plugins' for t in node.targets
+            ):
+                values = node.value.elts if isinstance(node.value, (ast.List, ast.Tuple)) else [node.value]
+                plugins.update(
+                    v.value for v in values if isinstance(v, ast.Constant) and isinstance(v.value, str)
+                )
+        return plugins
+    
+    @staticmethod
+    def _is_test_file(rel: Path) -> bool:
+        return rel.name.startswith('test_') or rel.stem.endswith('_test')
+    
+    @staticmethod
+    def _resolve_import(imp: dict, files: dict) -> list:
+        """import 문을 내부 모듈 이름으로 변환 (상대 import는 이름 끝이 같은 모듈로 추정)"""
+        module = imp["module"]
+        candidates = [module]
+        if imp["type"] == "from" and imp.get("name") != '*':
+            candidates.append(f"{module}.{imp['name']}" if module else imp["name"])
+        
+        targets = []
+        for candidate in candidates:
+            if candidate in files:
+                targets.append(candidate)
+            elif candidate:
+                targets.extend(name for name in files if name.endswith('.' + candidate))
+        
+        # 패키지 하위 모듈을 import하면 상위 패키지 __init__도 실행됨
+        for target in list(targets):
+            parts = target.split('.')
+            targets.extend('.'.join(parts[:i]) for i in range(1, len(parts)) if '.'.join(parts[:i]) in files)
+        return targets
+    
     def check_api_health(self):
         """API 헬스체크"""
         self.log("\n🌐 API 헬스체크", 'header')
@@ -261,6 +787,26 @@ class SystemChecker:
             except Exception as e:
                 self.add_result(name, False, str(e))
     
+    def check_api_slo(self):
+        """API 지연시간 SLO 검사 (프로덕션 모드만, debug-api.py --slo)"""
+        if self.mode != 'prod':
+            return
+        
+        self.log("\n⏱️ API 지연시간 SLO", 'header')
+        
+        api_checker = self.dev_kit_root / 'tools' / 'debug-api.py'
+        success, stdout, stderr = self.run_command(
+            [sys.executable, str(api_checker), self.prod_backend_url, '--slo'],
+            timeout=600
+        )
+        
+        if success:
+            self.add_result("API 지연시간 SLO", True)
+        else:
+            # 엔드포인트별 ❌ 줄만 (색상 코드 제거)
+            violations = [re.sub(r'\033\[[0-9;]*m', '', line).strip() for line in stdout.splitlines() if '❌' in line]
+            self.add_result("API 지연시간 SLO", False, '\n'.join(violations) or stderr[:200])
+    
     def check_dependencies(self):
         """의존성 확인"""
         self.log("\n📦 의존성 확인", 'header')
@@ -284,25 +830,217 @@ class SystemChecker:
         else:
             self.add_result("Frontend package.json", False, "파일 없음")
     
+    # ========================================
+    # 결과 캐시 (입력 지문)
+    # ========================================
+    
+    def _load_check_cache(self) -> dict:
+        """캐시 파일 로드 (없거나 깨졌으면 빈 캐시)"""
+        if not self.cache_file.exists():
+            return {}
+        try:
+            with open(self.cache_file, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+    
+    def _save_check_cache(self):
+        try:
+            with open(self.cache_file, 'w', encoding='utf-8') as f:
+                json.dump(self.check_cache, f, indent=2, ensure_ascii=False)
+        except OSError as e:
+            self.log(f"⚠️ 캐시 저장 실패: {e}", 'warning')
+    
+    def source_fingerprint(self, source: str) -> str:
+        """
+        입력 소스('backend' | 'frontend' | 'tool:파일명')의 지문
+        
+        tool:은 tools/ 아래 스크립트 파일 내용 해시.
+        git 저장소면 HEAD 트리 해시 + 변경/추적 안 된 파일 내용 해시,
+        아니면 모든 파일(의존성/빌드 폴더 제외) 내용 해시
+        """
+        with self._cache_lock:
+            if source in self._fingerprints:
+                return self._fingerprints[source]
+        
+        root = self.backend_root if source == 'backend' else self.frontend_root
+        digest = hashlib.sha1(source.encode())
+        
+        if source.startswith('tool:'):
+            try:
+                digest.update((self.dev_kit_root / 'tools' / source[5:]).read_bytes())
+            except OSError:
+                digest.update(b'missing')
+        elif not root.exists():
+            digest.update(b'missing')
+        else:
+            success, tree, _ = self.run_command(['git', 'rev-parse', 'HEAD^{tree}'], cwd=root)
+            if success:
+                _, status, _ = self.run_command(
+                    ['git', 'status', '--porcelain', '-z', '--untracked-files=all'], cwd=root
+                )
+                digest.update(tree.encode())
+                digest.update(status.encode())
+                files = sorted(root / path for _, path, _ in self._parse_porcelain(status))
+            else:
+                files = sorted(
+                    path for path in root.rglob('*')
+                    if path.is_file() and not FINGERPRINT_SKIP_DIRS.intersection(path.relative_to(root).parts)
+                )
+            
+            for path in files:
+                digest.update(str(path.relative_to(root)).encode())
+                try:
+                    digest.update(hashlib.sha1(path.read_bytes()).digest())
+                except OSError:
+                    digest.update(b'unreadable')
+        
+        fingerprint = digest.hexdigest()
+        with self._cache_lock:
+            self._fingerprints[source] = fingerprint
+        return fingerprint
+    
+    @staticmethod
+    def _parse_porcelain(status: str) -> list:
+        """
+        `git status --porcelain -z` 출력 -> [(상태 코드, 경로, 원래 경로 또는 None)]
+        
+        -z 출력은 경로를 따옴표/8진수 이스케이프 없이 그대로 담고,
+        이름 변경/복사 항목은 다음 필드에 원래 경로가 옴
+        """
+        fields = status.split('\0')
+        entries = []
+        i = 0
+        while i < len(fields):
+            field = fields[i]
+            i += 1
+            if len(field) < 4:
+                continue
+            code, path, orig = field[:2], field[3:], None
+            if 'R' in code or 'C' in code:
+                orig = fields[i] if i < len(fields) else None
+                i += 1
+            entries.append((code, path, orig))
+        return entries
+    
+    def check_fingerprint(self, name: str) -> str:
+        """검사 입력 지문 (입력 소스가 없으면 None = 캐시하지 않음)"""
+        sources = self.CHECKS[name][2]
+        if not sources:
+            return None
+        
+        # 검사 로직(이 파일)이 바뀌어도 캐시 무효화
+        digest = hashlib.sha1(f"{name}:{self.mode}".encode())
+        digest.update(hashlib.sha1(Path(__file__).read_bytes()).digest())
+        for source in sources:
+            digest.update(self.source_fingerprint(source).encode())
+        return digest.hexdigest()
+    
     # ========================================
     # 실행
     # ========================================
     
+    def _run_check(self, name: str, buffered: bool) -> tuple:
+        """검사 하나 실행, (로그 줄, 결과) 반환"""
+        method = getattr(self, self.CHECKS[name][0])
+        self._local.log = [] if buffered else None
+        self._local.results = []
+        self._local.check = name
+        self._local.partial = False
+        self._local.usage = {'cpu_seconds': 0.0, 'max_rss_kb': 0} if resource else None
+        started_at = datetime.now()
+        started = time.perf_counter()
+        try:
+            fingerprint = self.check_fingerprint(name) if self.use_cache else None
+            cached = self.check_cache.get(name) if fingerprint else None
+            
+            if cached and cached['fingerprint'] == fingerprint:
+                self.cache_status[name] = 'hit'
+                self.log(f"\n♻️ {name}: 입력 변경 없음, 마지막 통과 결과 재사용", 'header')
+                for result in cached['results']:
+                    self.add_result(result['name'], result['passed'], result['details'])
+                    self._local.results[-1]['cached'] = True
+            else:
+                if fingerprint:
+                    self.cache_status[name] = 'miss'
+                method()
+                
+                # 전부 통과한 결과만 캐시 (--changed로 일부 테스트만 실행한 결과 제외)
+                results = self._local.results
+                if fingerprint and results and all(r['passed'] for r in results) and not self._local.partial:
+                    with self._cache_lock:
+                        self.check_cache[name] = {'fingerprint': fingerprint, 'results': results}
+        except Exception as e:
+            self.add_result(name, False, f"검사 중 예외: {e}")
+        finally:
+            timing = {
+                'passed': bool(self._local.results) and all(r['passed'] for r in self._local.results),
+                'start': started_at.isoformat(),
+                'end': datetime.now().isoformat(),
+                'duration': time.perf_counter() - started,
+            }
+            if self._local.usage is not None:
+                timing.update(self._local.usage)
+            self.timings[name] = timing
+            
+            log, results = self._local.log, self._local.results
+            self._local.log = None
+            self._local.results = None
+            self._local.check = None
+            self._local.usage = None
+        return log or [], results
+    
+    def run_checks(self):
+        """
+        의존성을 지키며 검사 실행
+        
+        선행 검사가 끝난 검사부터 워커 풀(jobs개)에 제출하고,
+        끝나는 대로 로그를 출력. 결과는 선언 순서로 self.results에 모음
+        """
+        results = {}
+        
+        if self.jobs == 1:
+            for name in self.CHECKS:
+                _, results[name] = self._run_check(name, buffered=False)
+        else:
+            pending = dict(self.CHECKS)
+            running = {}
+            
+            with ThreadPoolExecutor(max_workers=self.jobs) as pool:
+                while pending or running:
+                    for name in list(pending):
+                        deps = pending[name][1]
+                        if all(dep in results for dep in deps):
+                            del pending[name]
+                            running[pool.submit(self._run_check, name, True)] = name
+                    
+                    done, _ = wait(running, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        name = running.pop(future)
+                        log, results[name] = future.result()
+                        with self._print_lock:
+                            for line in log:
+                                print(line)
+        
+        for name in self.CHECKS:
+            self.results.extend(results[name])
+        
+        if self.use_cache:
+            self._save_check_cache()
+    
     def run(self):
         """전체 검사 실행"""
         self.log(f"\n{'='*60}", 'header')
         self.log(f"   🔧 종합 시스템 검사 (Full System Check)", 'header')
         self.log(f"   모드: {'🏠 Local' if self.mode == 'local' else '🌐 Production'}", 'header')
+        self.log(f"   동시 실행: {self.jobs}", 'header')
         self.log(f"{'='*60}", 'header')
         
+        # 실행 시작 시점의 backend 상태 (--changed 기준점으로 기록)
+        self.backend_start = self.backend_state()
+        
         # 검사 실행
-        self.check_dependencies()
-        self.check_git_status()
-        self.check_imports()
-        self.check_typescript()
-        self.check_build()
-        self.check_tests()
-        self.check_api_health()
+        self.run_checks()
         
         # 결과 요약
         elapsed = (datetime.now() - self.start_time).total_seconds()
@@ -312,6 +1050,16 @@ class SystemChecker:
         self.log(f"\n{'='*60}", 'header')
         self.log(f"   📊 검사 결과: {passed}/{total} 통과", 'header')
         self.log(f"   ⏱️ 소요 시간: {elapsed:.1f}초", 'header')
+        for name in self.CHECKS:
+            timing = self.timings[name]
+            cpu = f", CPU {timing['cpu_seconds']:.1f}초" if 'cpu_seconds' in timing else ""
+            rss = f", RSS {timing['max_rss_kb'] / 1024:.0f}MB" if timing.get('max_rss_kb') else ""
+            self.log(f"      - {name}: {timing['duration']:.1f}초{cpu}{rss}", 'header')
+        if self.cache_status:
+            hits = [name for name, status in self.cache_status.items() if status == 'hit']
+            misses = [name for name, status in self.cache_status.items() if status == 'miss']
+            self.log(f"   ♻️ 캐시: 적중 {len(hits)} ({', '.join(hits) or '-'}), "
+                     f"미스 {len(misses)} ({', '.join(misses) or '-'})", 'header')
         self.log(f"{'='*60}", 'header')
         
         if passed == total:
@@ -328,16 +1076,160 @@ class SystemChecker:
                 'passed': passed,
                 'total': total,
                 'elapsed_seconds': elapsed,
+                'cache': self.cache_status,
+                'checks': self.timings,
                 'results': self.results
             }, f, indent=2, ensure_ascii=False)
         
+        self.append_history(elapsed, passed == total)
+        
         return passed == total
+    
+    # ========================================
+    # 기록 / 리포트
+    # ========================================
+    
+    def load_history(self) -> list:
+        """검사 기록 로드 (오래된 순)"""
+        if not self.history_file.exists():
+            return []
+        
+        runs = []
+        with open(self.history_file, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    runs.append(json.loads(line))
+                except ValueError:
+                    continue
+        return runs
+    
+    def append_history(self, elapsed: float, passed: bool):
+        """이번 실행을 기록 파일에 추가 (HISTORY_LIMIT회 초과분은 삭제)"""
+        entry = {
+            'timestamp': self.start_time.isoformat(),
+            'mode': self.mode,
+            'jobs': self.jobs,
+            'shards': self.shards,
+            'incremental': self.incremental,
+            'passed': passed,
+            'elapsed_seconds': elapsed,
+            'cache': self.cache_status,
+            'checks': self.timings,
+            'backend_commit': self.backend_start[0],
+            'backend_dirty': self.backend_start[1],
+        }
+        
+        try:
+            runs = self.load_history()
+            if len(runs) >= HISTORY_LIMIT:
+                runs = runs[-(HISTORY_LIMIT - 1):] + [entry]
+                with open(self.history_file, 'w', encoding='utf-8') as f:
+                    for run in runs:
+                        f.write(json.dumps(run, ensure_ascii=False) + '\n')
+            else:
+                with open(self.history_file, 'a', encoding='utf-8') as f:
+                    f.write(json.dumps(entry, ensure_ascii=False) + '\n')
+        except OSError as e:
+            self.log(f"⚠️ 기록 저장 실패: {e}", 'warning')
+    
+    def backend_state(self) -> tuple:
+        """backend (HEAD 커밋, 커밋되지 않은 경로 목록), git 저장소가 아니면 (None, [])"""
+        if not self.backend_root.exists():
+            return None, []
+        success, stdout, _ = self.run_command(['git', 'rev-parse', 'HEAD'], cwd=self.backend_root)
+        if not success:
+            return None, []
+        
+        _, status, _ = self.run_command(
+            ['git', 'status', '--porcelain', '-z', '--untracked-files=all'], cwd=self.backend_root
+        )
+        dirty = set()
+        for _, path, orig in self._parse_porcelain(status):
+            dirty.add(path)
+            if orig:
+                dirty.add(orig)
+        return stdout.strip(), sorted(dirty)
+    
+    def report(self, runs: int = REPORT_RUNS) -> bool:
+        """
+        현재와 같은 설정(모드/테스트 분할/--changed)의 최근 runs회 기록에서
+        검사별 소요 시간 추이 출력
+        
+        마지막 실행 시간이 이전 실행들의 중앙값보다 SLOWDOWN_THRESHOLD배 이상
+        (그리고 SLOWDOWN_MIN_SECONDS 이상) 길면 느려진 것으로 표시.
+        캐시 적중으로 건너뛴 실행은 비교에서 제외
+        """
+        history = [
+            run for run in self.load_history()
+            if run.get('mode') == self.mode
+            and run.get('shards', 1) == self.shards
+            and run.get('incremental', False) == self.incremental
+        ][-runs:]
+        
+        self.log(f"\n{'='*60}", 'header')
+        self.log(f"   📈 검사 시간 추이 (최근 {len(history)}회, {self.mode})", 'header')
+        self.log(f"{'='*60}", 'header')
+        
+        if len(history) < 2:
+            self.log("\n기록이 2회 미만입니다. full-check를 더 실행한 뒤 확인하세요.", 'warning')
+            return True
+        
+        slower = []
+        for name in self.CHECKS:
+            durations = [
+                run['checks'][name]['duration'] for run in history
+                if name in run.get('checks', {}) and run.get('cache', {}).get(name) != 'hit'
+            ]
+            if len(durations) < 2:
+                continue
+            
+            *previous, latest = durations
+            baseline = sorted(previous)[len(previous) // 2]
+            ratio = latest / baseline if baseline > 0 else 1.0
+            
+            level = 'info'
+            if ratio >= SLOWDOWN_THRESHOLD and latest - baseline >= SLOWDOWN_MIN_SECONDS:
+                level = 'error'
+                slower.append(name)
+            elif ratio <= 1 / SLOWDOWN_THRESHOLD:
+                level = 'success'
+            
+            self.log(f"  {name:<14} 최근 {latest:7.1f}초 | 중앙값 {baseline:7.1f}초 | "
+                     f"{(ratio - 1) * 100:+6.0f}% ({len(durations)}회)", level)
+        
+        if slower:
+            self.log(f"\n❌ 느려진 검사: {', '.join(slower)}", 'error')
+        else:
+            self.log("\n✅ 느려진 검사 없음", 'success')
+        
+        return not slower
 
 
 def main():
     mode = 'prod' if '--prod' in sys.argv else 'local'
     
-    checker = SystemChecker(mode=mode)
+    if '--report' in sys.argv:
+        index = sys.argv.index('--report') + 1
+        runs = int(sys.argv[index]) if index < len(sys.argv) and sys.argv[index].isdigit() else REPORT_RUNS
+        checker = SystemChecker(
+            mode=mode,
+            incremental='--changed' in sys.argv,
+            shards=int(sys.argv[sys.argv.index('--shards') + 1]) if '--shards' in sys.argv else 1
+        )
+        sys.exit(0 if checker.report(runs) else 1)
+    
+    jobs = DEFAULT_JOBS
+    if '--jobs' in sys.argv:
+        jobs = int(sys.argv[sys.argv.index('--jobs') + 1])
+    
+    checker = SystemChecker(
+        mode=mode,
+        jobs=jobs,
+        use_cache='--no-cache' not in sys.argv,
+        stream='--quiet' not in sys.argv,
+        incremental='--changed' in sys.argv,
+        shards=int(sys.argv[sys.argv.index('--shards') + 1]) if '--shards' in sys.argv else 1
+    )
     success = checker.run()
     
     sys.exit(0 if success else 1)
@@ -10,19 +10,181 @@ Created: 2026-01-20
 
 import os
 import re
+import sys
 import json
+import math
+import time
+import heapq
+import marshal
+import hashlib
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
 from pathlib import Path
 from typing import List, Dict, Optional, Any
 from dataclasses import dataclass, field
 from datetime import datetime
 
 
+# 검색 대상 소스 폴더
+SOURCES = ["incidents", "knowhow", "sessions"]
+
+# 디스크 인덱스 캐시 (blackbox/.index/index.marshal)
+# 포스팅 리스트가 수십만 항목이라 JSON은 로드가 원본 파싱보다 느려짐.
+# marshal은 dict/list/str/int만 복원하고 코드를 실행하지 않으므로 심어진 파일도 안전하고,
+# 같은 문서 키 문자열을 참조로 한 번만 저장/생성하므로 메모리도 작음
+INDEX_DIR = ".index"
+INDEX_FILE = "index.marshal"
+INDEX_VERSION = 4
+
+# 디스크 캐시에 저장하는 문서 필드 (원본 레코드/토큰은 저장하지 않음)
+CACHED_FIELDS = ("source", "file", "title", "solution", "prevention", "lengths")
+
+# 파일 로드 기본 워커 수 (I/O 대기 위주라 CPU 수보다 크게)
+DEFAULT_WORKERS = min(32, (os.cpu_count() or 1) + 4)
+
+# watch 모드 기본 폴링 주기 (초)
+WATCH_INTERVAL = 2.0
+
+# watch 모드에서 디스크 캐시를 다시 쓰는 최소 간격 (초, 변경분은 모아서 저장)
+WATCH_SAVE_INTERVAL = 30.0
+
+# 공용 검색기: 소스 폴더 mtime이 그대로여도 이 주기(초)마다 한 번은 refresh
+# (폴더 mtime은 파일 추가/삭제만 반영하고 제자리 수정은 반영하지 않음)
+SHARED_REFRESH_INTERVAL = 5.0
+
+# 쿼리 결과 LRU 캐시 크기 (키워드 집합 단위)
+QUERY_CACHE_SIZE = 256
+
+# 필드별 포스팅을 따로 유지하는 필드 (가중치 계산용)
+INDEXED_FIELDS = ["title", "symptom", "error_log", "pattern"]
+
+# 필드별 기본 가중치 ("body"는 레코드 전체)
+DEFAULT_FIELD_BOOSTS = {
+    "body": 1.0,
+    "title": 1.5,
+    "symptom": 2.0,
+    "error_log": 1.5,
+    "pattern": 2.0,
+}
+
+# 쿼리 키워드: 한 번의 스캔으로 따옴표 식별자 / .py 파일 / 대문자 단어를 추출.
+# 소문자 단어는 통째로 건너뛰어 긴 트레이스백에서도 역추적이 선형으로 유지됨
+_KEYWORD_RE = re.compile(r"""
+    '(?P<quoted>[a-zA-Z_][a-zA-Z0-9_]*)'
+  | (?<![a-z0-9_])(?P<file>[a-z_][a-z0-9_]*\.py)
+  | (?P<word>[A-Z][a-zA-Z]+)
+  | [a-z0-9_]+
+""", re.VERBOSE)
+
+# 대문자 단어 안의 에러 타입
+_ERROR_TYPE_RE = re.compile(r"[A-Z][a-z]+Error|Exception|Failed")
+
+# 쿼리당 최대 키워드 수
+MAX_KEYWORDS = 15
+
+# 문서 토큰: 식별자 단위, "xxx.py"는 파일명 토큰도 함께 생성
+_TOKEN_RE = re.compile(r"(\w+)(\.py\b)?")
+
+
+def _tokenize(text: str) -> Dict[str, int]:
+    """텍스트를 소문자 토큰 -> 출현 횟수로 변환"""
+    tokens: Dict[str, int] = {}
+    for match in _TOKEN_RE.finditer(text.lower()):
+        token = match.group(1)
+        tokens[token] = tokens.get(token, 0) + 1
+        if match.group(2):
+            token += match.group(2)
+            tokens[token] = tokens.get(token, 0) + 1
+    return tokens
+
+
+def _flatten_text(value: Any) -> str:
+    """JSON 값의 모든 문자열을 하나의 텍스트로 합침"""
+    if isinstance(value, dict):
+        return " ".join(_flatten_text(v) for v in value.values())
+    if isinstance(value, list):
+        return " ".join(_flatten_text(v) for v in value)
+    if value is None:
+        return ""
+    return str(value)
+
+
+def _make_document(source: str, json_file: Path, data: Any, compact: bool = False) -> Dict:
+    """
+    인덱스 항목 생성 (결과 표시용 필드는 미리 추출)
+    
+    compact=True면 원본 레코드(data)는 버리고 path로만 참조
+    """
+    if not isinstance(data, dict):
+        data = {"value": data}
+    
+    title = data.get("title") or data.get("pattern") or data.get("date", "Unknown")
+    
+    solution = None
+    if "solution" in data:
+        if isinstance(data["solution"], dict):
+            solution = data["solution"].get("description")
+        else:
+            solution = str(data["solution"])
+    
+    prevention = None
+    if "prevention" in data:
+        if isinstance(data["prevention"], dict):
+            prevention = data["prevention"].get("rule")
+        else:
+            prevention = str(data["prevention"])
+    
+    terms = {"body": _tokenize(_flatten_text(data))}
+    for name in INDEXED_FIELDS:
+        if name in data:
+            terms[name] = _tokenize(str(data[name]))
+    
+    lengths = {name: sum(tokens.values()) for name, tokens in terms.items()}
+    
+    item = {
+        "key": f"{source}/{json_file.name}",
+        "source": source,
+        "file": str(json_file.name),
+        "path": str(json_file),
+        "title": title,
+        "solution": solution,
+        "prevention": prevention,
+        "terms": terms,
+        "lengths": lengths,
+    }
+    if not compact:
+        item["data"] = data
+    return item
+
+
+def _load_document(source: str, json_file: Path, known_sha1: Optional[str] = None,
+                   compact: bool = False):
+    """
+    파일 하나를 읽어 (서명, 인덱스 항목) 반환
+    
+    내용 해시가 known_sha1과 같으면 파싱을 건너뛰고 항목 대신 None 반환.
+    워커 풀에서 실행되므로 모듈 함수로 둠 (프로세스 풀은 pickle 필요)
+    """
+    stat = json_file.stat()
+    raw = json_file.read_bytes()
+    digest = hashlib.sha1(raw).hexdigest()
+    signature = {"mtime": stat.st_mtime_ns, "size": stat.st_size, "sha1": digest}
+    
+    if digest == known_sha1:
+        return signature, None
+    
+    data = json.loads(raw.decode("utf-8"))
+    del raw
+    return signature, _make_document(source, json_file, data, compact)
+
+
 @dataclass
 class SearchResult:
     """검색 결과"""
     source: str           # "incident", "knowhow", "session"
     file: str
-    relevance_score: float
+    relevance_score: float  # scorer 점수 (BM25 기본, 상한 없음)
     matched_keywords: List[str]
     title: str
     solution: Optional[str] = None
@@ -30,6 +192,68 @@ class SearchResult:
     data: Dict = field(default_factory=dict)
 
 
+class BM25Scorer:
+    """
+    BM25F 점수 계산
+    
+    필드별 tf를 길이 정규화 후 가중치로 합산하고,
+    문서 빈도(df)로 계산한 idf를 곱함
+    """
+    
+    def __init__(self, k1: float = 1.2, b: float = 0.75, field_boosts: Dict[str, float] = None):
+        self.k1 = k1
+        self.b = b
+        self.field_boosts = field_boosts or DEFAULT_FIELD_BOOSTS
+    
+    def idf(self, searcher: "RLMBlackboxSearch", term: str) -> float:
+        n = len(searcher.docs)
+        df = len(searcher.postings["body"].get(term, ()))
+        return math.log(1 + (n - df + 0.5) / (df + 0.5))
+    
+    def term_weights(self, searcher: "RLMBlackboxSearch", term: str) -> Dict[str, float]:
+        """term이 나오는 문서별 점수 기여분"""
+        weights: Dict[str, float] = {}
+        for name, boost in self.field_boosts.items():
+            postings = searcher.postings[name].get(term)
+            if not postings:
+                continue
+            avg_length = searcher.avg_length(name)
+            for key, tf in postings.items():
+                length = searcher.docs[key]["lengths"][name]
+                norm = 1 - self.b + self.b * length / avg_length
+                weights[key] = weights.get(key, 0.0) + boost * tf / norm
+        
+        if not weights:
+            return {}
+        
+        idf = self.idf(searcher, term)
+        return {key: idf * w / (self.k1 + w) for key, w in weights.items()}
+
+
+class TfIdfScorer(BM25Scorer):
+    """TF-IDF 점수 계산 (로그 tf, 필드 가중치 합산)"""
+    
+    def __init__(self, field_boosts: Dict[str, float] = None):
+        super().__init__(field_boosts=field_boosts)
+    
+    def idf(self, searcher: "RLMBlackboxSearch", term: str) -> float:
+        n = len(searcher.docs)
+        df = len(searcher.postings["body"].get(term, ()))
+        return math.log((n + 1) / (df + 1)) + 1
+    
+    def term_weights(self, searcher: "RLMBlackboxSearch", term: str) -> Dict[str, float]:
+        weights: Dict[str, float] = {}
+        for name, boost in self.field_boosts.items():
+            for key, tf in searcher.postings[name].get(term, {}).items():
+                weights[key] = weights.get(key, 0.0) + boost * (1 + math.log(tf))
+        
+        if not weights:
+            return {}
+        
+        idf = self.idf(searcher, term)
+        return {key: idf * w for key, w in weights.items()}
+
+
 class RLMBlackboxSearch:
     """
     RLM 기반 Blackbox 검색
@@ -37,14 +261,56 @@ class RLMBlackboxSearch:
     RLM 패턴:
     1. 에러 메시지에서 키워드 추출 (프로그래밍적)
     2. 각 소스(incidents, knowhow, sessions)에서 필터링
-    3. 관련성 점수 계산
+    3. 관련성 점수 계산 (BM25, scorer로 교체 가능)
     4. 결과 집계 및 순위화
     """
     
-    def __init__(self, blackbox_path: str = None):
+    def __init__(self, blackbox_path: str = None, use_cache: bool = True, scorer: BM25Scorer = None,
+                 query_cache_size: int = QUERY_CACHE_SIZE, workers: int = None,
+                 use_processes: bool = False, compact: bool = False):
         self.blackbox_path = Path(blackbox_path) if blackbox_path else self._find_blackbox()
+        self.use_cache = use_cache
+        
+        # compact 모드: 검색 필드만 메모리에 두고 원본 레코드는 결과 반환 시 로드
+        self.compact = compact
+        
+        # 파일 로드 워커 수 (1이면 순차), use_processes=True면 파싱까지 프로세스 풀에서
+        self.workers = workers if workers is not None else DEFAULT_WORKERS
+        self.use_processes = use_processes
+        self.scorer = scorer or BM25Scorer()
+        self.query_cache_size = query_cache_size
+        
+        # 쿼리 캐시: (키워드 집합, top_n) -> [(문서 키, 점수, 일치 키워드)] (인덱스가 바뀌면 비움).
+        # 원본 레코드를 붙잡지 않도록 결과 객체는 꺼낼 때마다 만듦
+        self._query_cache: "OrderedDict[tuple, List[tuple]]" = OrderedDict()
+        self._query_lock = threading.Lock()
+        
+        # 인덱스 잠금: 검색(읽기)과 refresh 병합(쓰기)을 직렬화.
+        # 파일 읽기/파싱은 잠금 밖에서 하므로 watch 중에도 검색이 막히지 않음
+        self._index_lock = threading.RLock()
+        self._refresh_lock = threading.Lock()
+        self._watch_thread: Optional[threading.Thread] = None
+        self._watch_stop = threading.Event()
+        
+        # 디스크 캐시에 아직 저장하지 않은 변경이 있는지
+        self._cache_dirty = False
+        
         self.index: Dict[str, List[Dict]] = {}
         
+        # 파일 서명: 문서 키 -> {"mtime", "size", "sha1"}
+        self.files: Dict[str, Dict] = {}
+        
+        # 역색인: 필드 -> 토큰 -> {문서 키: tf} ("body"는 레코드 전체)
+        self.docs: Dict[str, Dict] = {}
+        self.postings: Dict[str, Dict[str, Dict[str, int]]] = {
+            name: {} for name in ["body"] + INDEXED_FIELDS
+        }
+        
+        # 필드 길이 통계: 필드 -> [길이 합계, 필드가 있는 문서 수]
+        self.field_stats: Dict[str, List[int]] = {
+            name: [0, 0] for name in ["body"] + INDEXED_FIELDS
+        }
+        
         if self.blackbox_path and self.blackbox_path.exists():
             self._build_index()
     
@@ -63,27 +329,322 @@ class RLMBlackboxSearch:
         return None
     
     def _build_index(self):
-        """JSON 파일 인덱싱"""
-        sources = ["incidents", "knowhow", "sessions"]
+        """JSON 파일 인덱싱 (디스크 캐시 로드 후 변경분만 재파싱)"""
+        if self.use_cache:
+            self._load_cache()
+        
+        self.refresh()
+    
+    def refresh(self, save: bool = True) -> bool:
+        """
+        디스크와 인덱스 동기화
+        
+        mtime/size가 같으면 건너뛰고, 달라도 내용 해시가 같으면 서명만 갱신.
+        추가/변경/삭제된 파일만 다시 파싱하며, 인덱스가 바뀌면 True 반환.
+        검색과 동시에 호출해도 안전함 (watch 스레드에서도 사용).
+        save=False면 디스크 캐시 저장을 미룸 (flush_cache()로 저장)
+        """
+        with self._refresh_lock:
+            changed = self._refresh()
+            if save:
+                self._save_cache()
+            return changed
+    
+    def flush_cache(self):
+        """미뤄 둔 디스크 캐시 저장 (변경이 없으면 아무것도 안 함)"""
+        with self._refresh_lock:
+            self._save_cache()
+    
+    def _refresh(self) -> bool:
+        changed = False
+        dirty = False
+        seen = set()
+        pending = []
         
-        for source in sources:
+        for source in SOURCES:
             source_path = self.blackbox_path / source
             if not source_path.exists():
                 continue
             
-            self.index[source] = []
+            self.index.setdefault(source, [])
+            
+            # Path 정렬/생성은 파일 수만큼 비싸므로 이름 문자열로 정렬하고 변경분만 Path 생성
+            with os.scandir(source_path) as entries:
+                names = sorted(e.name for e in entries
+                               if e.name.endswith(".json") and not e.name.startswith("."))
+            
+            for name in names:
+                key = f"{source}/{name}"
+                seen.add(key)
+                
+                try:
+                    stat = os.stat(f"{source_path}/{name}")
+                except OSError as e:
+                    print(f"[WARN] Failed to load {source_path / name}: {e}")
+                    continue
+                
+                signature = self.files.get(key)
+                if (signature and signature["mtime"] == stat.st_mtime_ns
+                        and signature["size"] == stat.st_size):
+                    continue
+                
+                known_sha1 = signature["sha1"] if signature and key in self.docs else None
+                pending.append((key, source, source_path / name, known_sha1))
+        
+        # 읽기/파싱은 워커 풀에 분산 (잠금 밖)
+        loaded = self._load_documents(pending)
+        
+        # 병합은 파일 순서대로 (잠금 안)
+        with self._index_lock:
+            added = []
+            for (key, source, json_file, _), (signature, item, error) in zip(pending, loaded):
+                if error is not None:
+                    print(f"[WARN] Failed to load {json_file}: {error}")
+                    continue
+                
+                self.files[key] = signature
+                if item is None:
+                    dirty = True
+                    continue
+                added.append(item)
+            
+            # 변경/삭제된 문서를 한 번에 제거한 뒤 새 항목 추가
+            deleted = [key for key in self.files if key not in seen]
+            for key in deleted:
+                del self.files[key]
+            self._remove_documents([item["key"] for item in added] + deleted)
+            
+            for item in added:
+                self._add_document(item)
+            changed = bool(added or deleted)
+            
+            if changed:
+                self.clear_query_cache()
             
-            for json_file in source_path.glob("*.json"):
+            if changed or dirty:
+                self._cache_dirty = True
+        
+        return changed
+    
+    def start_watch(self, interval: float = WATCH_INTERVAL):
+        """
+        watch 모드 시작 (opt-in)
+        
+        백그라운드 스레드가 interval초마다 refresh()를 호출해 추가/변경/삭제된
+        파일만 인덱스에 반영. 표준 라이브러리만 쓰는 mtime 폴링 방식.
+        디스크 캐시는 매번 쓰지 않고 WATCH_SAVE_INTERVAL초에 한 번, 중지할 때 저장
+        """
+        if self._watch_thread is not None or not self.blackbox_path:
+            return
+        
+        self._watch_stop.clear()
+        
+        def watch():
+            last_save = time.monotonic()
+            while not self._watch_stop.wait(interval):
                 try:
-                    with open(json_file, "r", encoding="utf-8") as f:
-                        data = json.load(f)
-                        self.index[source].append({
-                            "file": str(json_file.name),
-                            "path": str(json_file),
-                            "data": data
-                        })
+                    self.refresh(save=False)
+                    if time.monotonic() - last_save >= WATCH_SAVE_INTERVAL:
+                        self.flush_cache()
+                        last_save = time.monotonic()
                 except Exception as e:
-                    print(f"[WARN] Failed to load {json_file}: {e}")
+                    print(f"[WARN] Blackbox watch refresh failed: {e}")
+            self.flush_cache()
+        
+        self._watch_thread = threading.Thread(target=watch, name="blackbox-watch", daemon=True)
+        self._watch_thread.start()
+    
+    def stop_watch(self):
+        """watch 모드 중지"""
+        if self._watch_thread is None:
+            return
+        
+        self._watch_stop.set()
+        self._watch_thread.join()
+        self._watch_thread = None
+    
+    def _load_documents(self, pending: List[tuple]) -> List[tuple]:
+        """pending 파일들을 워커 풀로 로드해 같은 순서로 (서명, 항목, 에러) 반환"""
+        if not pending:
+            return []
+        
+        workers = min(self.workers, len(pending))
+        if workers <= 1:
+            futures = None
+        else:
+            pool_cls = ProcessPoolExecutor if self.use_processes else ThreadPoolExecutor
+            pool = pool_cls(max_workers=workers)
+            futures = [pool.submit(_load_document, source, json_file, known_sha1, self.compact)
+                       for _, source, json_file, known_sha1 in pending]
+        
+        results = []
+        for i, (_, source, json_file, known_sha1) in enumerate(pending):
+            try:
+                if futures is None:
+                    signature, item = _load_document(source, json_file, known_sha1, self.compact)
+                else:
+                    signature, item = futures[i].result()
+                results.append((signature, item, None))
+            except Exception as e:
+                results.append((None, None, e))
+        
+        if futures is not None:
+            pool.shutdown()
+        
+        return results
+    
+    def _cache_path(self) -> Path:
+        return self.blackbox_path / INDEX_DIR / INDEX_FILE
+    
+    def _load_cache(self):
+        """
+        디스크 인덱스 캐시 로드 (없거나 깨졌으면 무시)
+        
+        포스팅 리스트를 그대로 올리고, 원본 레코드는 검색 결과로 쓰일 때 파일에서 로드
+        """
+        cache_path = self._cache_path()
+        if not cache_path.exists():
+            return
+        
+        try:
+            with open(cache_path, "rb") as f:
+                cache = marshal.load(f)
+        except (OSError, EOFError, ValueError, TypeError) as e:
+            print(f"[WARN] Ignoring broken index cache {cache_path}: {e}")
+            return
+        
+        if not isinstance(cache, dict) or cache.get("version") != INDEX_VERSION:
+            return
+        
+        files = cache.get("files", {})
+        docs = cache.get("docs", {})
+        if set(files) != set(docs):
+            return
+        
+        for name, postings in cache.get("postings", {}).items():
+            if name in self.postings:
+                self.postings[name] = postings
+        
+        root = str(self.blackbox_path)
+        for key, item in docs.items():
+            item["key"] = key
+            item["path"] = f"{root}/{key}"
+            self.docs[key] = item
+            self.index.setdefault(item["source"], []).append(item)
+            for name, length in item["lengths"].items():
+                self.field_stats[name][0] += length
+                self.field_stats[name][1] += 1
+            self.files[key] = files[key]
+    
+    def _save_cache(self):
+        """
+        변경이 있으면 디스크 인덱스 캐시 저장 (임시 파일 작성 후 교체, _refresh_lock 안에서 호출)
+        
+        인덱스 잠금 안에서는 스냅샷 복사만 하고, 직렬화/쓰기는 잠금 밖에서 하므로
+        저장 중에도 검색이 막히지 않음
+        """
+        if not self.use_cache or not self._cache_dirty:
+            return
+        
+        with self._index_lock:
+            snapshot = {
+                "version": INDEX_VERSION,
+                "files": dict(self.files),
+                "docs": {key: {k: item[k] for k in CACHED_FIELDS} for key, item in self.docs.items()},
+                "postings": {name: {token: keys.copy() for token, keys in postings.items()}
+                             for name, postings in self.postings.items()},
+            }
+            self._cache_dirty = False
+        
+        cache_path = self._cache_path()
+        
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = cache_path.with_suffix(".tmp")
+            with open(tmp_path, "wb") as f:
+                marshal.dump(snapshot, f)
+            os.replace(tmp_path, cache_path)
+        except (OSError, ValueError) as e:
+            self._cache_dirty = True
+            print(f"[WARN] Failed to save index cache {cache_path}: {e}")
+    
+    def _add_document(self, item: Dict):
+        """
+        항목을 인덱스와 포스팅 리스트에 추가
+        
+        compact 모드에서는 tf가 포스팅에만 있으면 되므로
+        항목에는 제거용 토큰 목록(tokens)만 남기고 terms는 버림.
+        토큰은 intern해서 포스팅 키와 같은 문자열 객체를 공유
+        """
+        key = item["key"]
+        self.docs[key] = item
+        self.index[item["source"]].append(item)
+        tokens_by_field = {}
+        for name, tokens in item["terms"].items():
+            postings = self.postings[name]
+            interned = []
+            for token, tf in tokens.items():
+                token = sys.intern(token)
+                postings.setdefault(token, {})[key] = tf
+                interned.append(token)
+            tokens_by_field[name] = tuple(interned)
+            self.field_stats[name][0] += item["lengths"][name]
+            self.field_stats[name][1] += 1
+        
+        if self.compact:
+            del item["terms"]
+            item["tokens"] = tokens_by_field
+    
+    def _remove_documents(self, keys: List[str]):
+        """
+        항목들을 인덱스와 포스팅 리스트에서 제거
+        
+        디스크 캐시에서 올린 항목은 토큰 목록이 없으므로,
+        그런 항목이 있으면 포스팅 리스트를 한 번만 훑어 함께 제거
+        """
+        sweep = set()
+        for key in keys:
+            item = self.docs.pop(key, None)
+            if item is None:
+                continue
+            
+            self.index[item["source"]].remove(item)
+            for name, length in item["lengths"].items():
+                self.field_stats[name][0] -= length
+                self.field_stats[name][1] -= 1
+            
+            terms = item.get("terms") or item.get("tokens")
+            if terms is None:
+                sweep.add(key)
+                continue
+            for name, tokens in terms.items():
+                postings = self.postings[name]
+                for token in tokens:
+                    doc_keys = postings.get(token)
+                    if doc_keys is not None:
+                        doc_keys.pop(key, None)
+                        if not doc_keys:
+                            del postings[token]
+        
+        if not sweep:
+            return
+        for postings in self.postings.values():
+            for token in list(postings):
+                doc_keys = postings[token]
+                for key in sweep:
+                    doc_keys.pop(key, None)
+                if not doc_keys:
+                    del postings[token]
+    
+    def clear_query_cache(self):
+        """쿼리 결과 캐시 비우기"""
+        with self._query_lock:
+            self._query_cache.clear()
+    
+    def avg_length(self, name: str) -> float:
+        """필드 평균 길이 (필드가 있는 문서 기준)"""
+        total, count = self.field_stats[name]
+        return (total / count) if total else 1.0
     
     def search(self, error_message: str, top_n: int = 5) -> List[SearchResult]:
         """
@@ -91,105 +652,142 @@ class RLMBlackboxSearch:
         
         RLM 패턴:
         1. 키워드 추출
-        2. 각 소스에서 매칭
-        3. 점수 계산 및 정렬
+        2. 포스팅 리스트로 후보 문서 점수 누적
+        3. 힙으로 상위 N개 선택
+        
+        같은 키워드 집합의 반복 검색은 LRU 캐시에서 바로 반환
         """
         keywords = self._extract_keywords(error_message)
-        results: List[SearchResult] = []
+        return list(self._search_keywords(keywords, top_n, {}))
+    
+    def search_many(self, errors: List[str], top_n: int = 5) -> List[List[SearchResult]]:
+        """
+        여러 에러 메시지를 한 번에 검색 (입력 순서대로 결과 리스트 반환)
         
-        # 각 소스에서 검색
-        for source, items in self.index.items():
-            for item in items:
-                matched = self._match_item(item["data"], keywords, source)
-                if matched:
-                    matched.file = item["file"]
-                    matched.source = source
-                    results.append(matched)
+        키워드 집합이 같은 입력은 한 번만 점수를 매기고,
+        키워드별 포스팅 가중치는 모든 입력이 공유
+        """
+        keyword_lists = [self._extract_keywords(error) for error in errors]
         
-        # 점수순 정렬
-        results.sort(key=lambda x: x.relevance_score, reverse=True)
+        # 배치 동안 인덱스가 바뀌지 않도록 잠금 (term_cache가 낡지 않게)
+        term_cache: Dict[str, Dict[str, float]] = {}
+        by_set: Dict[frozenset, List[SearchResult]] = {}
+        with self._index_lock:
+            for keywords in keyword_lists:
+                key_set = frozenset(keywords)
+                if key_set not in by_set:
+                    by_set[key_set] = self._search_keywords(keywords, top_n, term_cache)
         
-        return results[:top_n]
+        return [list(by_set[frozenset(keywords)]) for keywords in keyword_lists]
     
-    def _extract_keywords(self, text: str) -> List[str]:
-        """에러 메시지에서 키워드 추출"""
-        keywords = []
+    def _search_keywords(self, keywords: List[str], top_n: int,
+                         term_cache: Dict[str, Dict[str, float]]) -> List[SearchResult]:
+        """
+        키워드 목록으로 점수 계산 (쿼리 캐시 사용)
+        
+        term_cache: 키워드 -> 문서별 가중치, 한 배치 안에서 재사용
+        """
+        cache_key = (frozenset(keywords), top_n)
         
-        # 에러 타입 추출
-        error_types = re.findall(r"([A-Z][a-z]+Error|Exception|Failed)", text)
-        keywords.extend(error_types)
+        # 결과를 캐시에 넣을 때까지 잠금 유지 (refresh가 지운 캐시에 옛 결과가 들어가지 않도록).
+        # 원본 레코드 로드(compact 모드의 파일 읽기)는 잠금 밖에서
+        with self._index_lock:
+            with self._query_lock:
+                top = self._query_cache.get(cache_key)
+                if top is not None:
+                    self._query_cache.move_to_end(cache_key)
+            if top is None:
+                top = self._score_keywords(keywords, top_n, term_cache)
+                if self.query_cache_size > 0:
+                    with self._query_lock:
+                        self._query_cache[cache_key] = top
+                        self._query_cache.move_to_end(cache_key)
+                        while len(self._query_cache) > self.query_cache_size:
+                            self._query_cache.popitem(last=False)
+            hits = [(self.docs[key], score, kws) for key, score, kws in top]
         
-        # 메서드/함수명 추출
-        methods = re.findall(r"'([a-zA-Z_][a-zA-Z0-9_]*)'", text)
-        keywords.extend(methods)
+        return [self._match_item(item, score, list(kws)) for item, score, kws in hits]
+    
+    def _score_keywords(self, keywords: List[str], top_n: int,
+                        term_cache: Dict[str, Dict[str, float]]) -> List[tuple]:
+        """상위 top_n개 [(문서 키, 점수, 일치 키워드)] (인덱스 잠금 안에서 호출)"""
+        # 키워드를 공유하는 문서만 점수 누적
+        scores: Dict[str, float] = {}
+        matched: Dict[str, List[str]] = {}
+        for kw in keywords:
+            weights = term_cache.get(kw)
+            if weights is None:
+                weights = term_cache[kw] = self.scorer.term_weights(self, kw)
+            for key, weight in weights.items():
+                scores[key] = scores.get(key, 0.0) + weight
+                matched.setdefault(key, []).append(kw)
+        
+        # 점수 내림차순, 동점이면 문서 키 순
+        top = heapq.nsmallest(top_n, scores.items(), key=lambda kv: (-kv[1], kv[0]))
+        return [(key, score, tuple(matched[key])) for key, score in top]
+    
+    def _extract_keywords(self, text: str) -> List[str]:
+        """
+        에러 메시지에서 키워드 추출
         
-        # 클래스명 추출
-        classes = re.findall(r"([A-Z][a-zA-Z]+)", text)
-        keywords.extend([c for c in classes if len(c) > 3])
+        한 번의 정규식 스캔으로 수집하고, 에러 타입 > 따옴표 식별자 >
+        클래스명 > 파일 경로 순, 같은 종류 안에서는 처음 나온 순으로 정렬
+        """
+        error_types: Dict[str, None] = {}
+        methods: Dict[str, None] = {}
+        classes: Dict[str, None] = {}
+        files: Dict[str, None] = {}
         
-        # 파일 경로 추출
-        files = re.findall(r"([a-z_]+\.py)", text)
-        keywords.extend(files)
+        for match in _KEYWORD_RE.finditer(text):
+            kind = match.lastgroup
+            if kind == "quoted":
+                methods[match.group(kind)] = None
+            elif kind == "file":
+                files[match.group(kind)] = None
+            elif kind == "word":
+                word = match.group(kind)
+                for error_type in _ERROR_TYPE_RE.findall(word):
+                    error_types[error_type] = None
+                if len(word) > 3:
+                    classes[word] = None
         
-        # 중복 제거 및 소문자화
-        keywords = list(set(k.lower() for k in keywords))
+        # 중복 제거 및 소문자화 (우선순위 순서 유지)
+        keywords: Dict[str, None] = {}
+        for group in (error_types, methods, classes, files):
+            for k in group:
+                keywords[k.lower()] = None
         
-        return keywords[:15]  # 상위 15개
+        return list(keywords)[:MAX_KEYWORDS]
     
-    def _match_item(self, data: Dict, keywords: List[str], source: str) -> Optional[SearchResult]:
-        """항목과 키워드 매칭"""
-        # JSON을 문자열로 변환
-        data_str = json.dumps(data, ensure_ascii=False).lower()
-        
-        matched_keywords = []
-        for kw in keywords:
-            if kw in data_str:
-                matched_keywords.append(kw)
-        
-        if not matched_keywords:
-            return None
-        
-        # 관련성 점수 계산
-        score = len(matched_keywords) / max(len(keywords), 1)
-        
-        # 특정 필드에서 매칭되면 가중치
-        if source == "incidents":
-            if any(kw in str(data.get("symptom", "")).lower() for kw in keywords):
-                score += 0.3
-            if any(kw in str(data.get("error_log", "")).lower() for kw in keywords):
-                score += 0.2
-        elif source == "knowhow":
-            if any(kw in str(data.get("pattern", "")).lower() for kw in keywords):
-                score += 0.3
-        
-        # 결과 생성
-        title = data.get("title") or data.get("pattern") or data.get("date", "Unknown")
-        
-        solution = None
-        if "solution" in data:
-            if isinstance(data["solution"], dict):
-                solution = data["solution"].get("description")
-            else:
-                solution = str(data["solution"])
-        
-        prevention = None
-        if "prevention" in data:
-            if isinstance(data["prevention"], dict):
-                prevention = data["prevention"].get("rule")
-            else:
-                prevention = str(data["prevention"])
+    def _match_item(self, item: Dict, score: float, matched_keywords: List[str]) -> SearchResult:
+        """인덱스 항목을 검색 결과로 변환 (원본 레코드가 메모리에 없으면 파일에서 로드)"""
+        data = item.get("data")
+        if data is None:
+            data = self._load_data(item)
+            if not self.compact:
+                item["data"] = data
         
         return SearchResult(
-            source=source,
-            file="",
-            relevance_score=min(score, 1.0),
+            source=item["source"],
+            file=item["file"],
+            relevance_score=score,
             matched_keywords=matched_keywords,
-            title=title,
-            solution=solution,
-            prevention=prevention,
+            title=item["title"],
+            solution=item["solution"],
+            prevention=item["prevention"],
             data=data
         )
     
+    def _load_data(self, item: Dict) -> Dict:
+        """원본 레코드를 파일에서 로드 (실패 시 빈 dict)"""
+        try:
+            with open(item["path"], "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except Exception as e:
+            print(f"[WARN] Failed to load {item['path']}: {e}")
+            return {}
+        return data if isinstance(data, dict) else {"value": data}
+    
     def get_prevention_checklist(self, error_message: str) -> List[str]:
         """에러 방지 체크리스트 생성"""
         results = self.search(error_message, top_n=3)
@@ -209,27 +807,76 @@ class RLMBlackboxSearch:
     
     def get_stats(self) -> Dict:
         """통계"""
-        return {
-            "sources": list(self.index.keys()),
-            "total_items": sum(len(items) for items in self.index.values()),
-            "by_source": {source: len(items) for source, items in self.index.items()}
-        }
+        with self._index_lock:
+            return {
+                "sources": list(self.index.keys()),
+                "total_items": sum(len(items) for items in self.index.values()),
+                "by_source": {source: len(items) for source, items in self.index.items()}
+            }
 
 
 # ============================================================================
 # Quick Access
 # ============================================================================
 
+_shared_searcher: Optional[RLMBlackboxSearch] = None
+_shared_lock = threading.Lock()
+
+# 공용 검색기 마지막 동기화 시점: (소스 폴더 mtime 서명, time.monotonic())
+_shared_synced: tuple = (None, 0.0)
+
+
+def _source_dirs_signature(blackbox_path: Path) -> tuple:
+    """소스 폴더들의 mtime (파일 추가/삭제/이름 변경 시 바뀜)"""
+    signature = []
+    for source in SOURCES:
+        try:
+            signature.append(os.stat(blackbox_path / source).st_mtime_ns)
+        except OSError:
+            signature.append(None)
+    return tuple(signature)
+
+
+def get_searcher(refresh: bool = False) -> RLMBlackboxSearch:
+    """
+    프로세스 공용 검색기
+    
+    처음 호출할 때 한 번만 인덱스를 만들고 이후에는 재사용.
+    소스 폴더 mtime이 바뀌었거나 마지막 동기화 후 SHARED_REFRESH_INTERVAL초가
+    지났으면 디스크 변경분을 반영 (바뀌면 쿼리 캐시도 비워짐).
+    refresh=True면 항상 반영
+    """
+    global _shared_searcher, _shared_synced
+    with _shared_lock:
+        if _shared_searcher is None:
+            _shared_searcher = RLMBlackboxSearch()
+            if _shared_searcher.blackbox_path:
+                _shared_synced = (_source_dirs_signature(_shared_searcher.blackbox_path), time.monotonic())
+        elif _shared_searcher.blackbox_path:
+            signature = _source_dirs_signature(_shared_searcher.blackbox_path)
+            now = time.monotonic()
+            if refresh or signature != _shared_synced[0] or now - _shared_synced[1] >= SHARED_REFRESH_INTERVAL:
+                _shared_searcher.refresh()
+                _shared_synced = (signature, now)
+        return _shared_searcher
+
+
+def reset_searcher():
+    """공용 검색기 폐기 (다음 호출 시 새로 생성)"""
+    global _shared_searcher, _shared_synced
+    with _shared_lock:
+        _shared_searcher = None
+        _shared_synced = (None, 0.0)
+
+
 def search_blackbox(error: str, top_n: int = 5) -> List[SearchResult]:
     """빠른 검색"""
-    searcher = RLMBlackboxSearch()
-    return searcher.search(error, top_n)
+    return get_searcher().search(error, top_n)
 
 
 def get_prevention(error: str) -> List[str]:
     """방지 체크리스트"""
-    searcher = RLMBlackboxSearch()
-    return searcher.get_prevention_checklist(error)
+    return get_searcher().get_prevention_checklist(error)
 
 
 # ============================================================================